@@ -18,8 +18,8 @@ from tqec.circuit.qubit import GridQubit
 from tqec.circuit.qubit_map import QubitMap
 from tqec.utils.exceptions import TQECException
 from tqec.utils.instructions import (
-    is_multi_qubit_measurement_instruction,
-    is_single_qubit_measurement_instruction,
+    MULTIPLE_QUBIT_MEASUREMENT_INSTRUCTION_NAMES,
+    SINGLE_QUBIT_MEASUREMENT_INSTRUCTION_NAMES,
 )
 from tqec.utils.position import Shift2D
 
@@ -144,12 +144,13 @@ def get_measurements_from_circuit(circuit: stim.Circuit) -> list[Measurement]:
                 "Found a REPEAT block in get_measurements_from_circuit. This "
                 "is not supported."
             )
-        if is_multi_qubit_measurement_instruction(instruction):
+        name = instruction.name
+        if name in MULTIPLE_QUBIT_MEASUREMENT_INSTRUCTION_NAMES:
             raise TQECException(
                 f"Got a multi-qubit measurement instruction ({instruction.name}) "
                 "but multi-qubit measurements are not supported yet."
             )
-        if is_single_qubit_measurement_instruction(instruction):
+        if name in SINGLE_QUBIT_MEASUREMENT_INSTRUCTION_NAMES:
             for (target,) in reversed(instruction.target_groups()):
                 if not target.is_qubit_target:
                     raise TQECException(
@@ -19,8 +19,8 @@ from tqec.circuit.qubit_map import QubitMap
 from tqec.circuit.schedule import ScheduledCircuit
 from tqec.utils.exceptions import TQECException
 from tqec.utils.instructions import (
-    is_multi_qubit_measurement_instruction,
-    is_single_qubit_measurement_instruction,
+    MULTIPLE_QUBIT_MEASUREMENT_INSTRUCTION_NAMES,
+    SINGLE_QUBIT_MEASUREMENT_INSTRUCTION_NAMES,
 )
 
 
@@ -139,11 +139,12 @@ class MeasurementRecordsMap:
                 raise TQECException(
                     "Found a REPEAT instruction. This is not supported for the moment."
                 )
-            if is_multi_qubit_measurement_instruction(instruction):
+            name = instruction.name
+            if name in MULTIPLE_QUBIT_MEASUREMENT_INSTRUCTION_NAMES:
                 raise TQECException(
                     f"Found a non-supported measurement instruction: {instruction}"
                 )
-            if is_single_qubit_measurement_instruction(instruction):
+            if name in SINGLE_QUBIT_MEASUREMENT_INSTRUCTION_NAMES:
                 for (qi,) in instruction.target_groups():
                     qubit = qubit_map.i2q[qi.value]
                     measurement_records.setdefault(qubit, []).append(
@@ -10,13 +10,16 @@ instead of using ``cirq`` data-structures.
 
 from __future__ import annotations
 
-from typing import Any, Callable, Iterable, Iterator, cast
+from typing import Any, Iterable, Iterator, cast
 
 import stim
 
 from tqec.circuit.qubit import count_qubit_accesses, get_used_qubit_indices
 from tqec.utils.exceptions import TQECException
-from tqec.utils.instructions import is_annotation_instruction
+from tqec.utils.instructions import (
+    ANNOTATION_INSTRUCTION_NAMES,
+    is_annotation_instruction,
+)
 
 
 class Moment:
@@ -224,8 +227,10 @@ class Moment:
         else:
             instruction = name_or_instr
 
-        if is_annotation_instruction(instruction):
-            self.append_annotation(instruction)
+        if instruction.name in ANNOTATION_INSTRUCTION_NAMES:
+            # Already known to be an annotation, so the check performed by
+            # append_annotation can be skipped.
+            self._circuit.append(instruction)
             return
 
         # Checking Moment invariant
@@ -373,7 +378,7 @@ class Moment:
 
 
 def iter_stim_circuit_without_repeat_by_moments(
-    circuit: stim.Circuit, collected_before_use: bool = True
+    circuit: stim.Circuit,
 ) -> Iterator[Moment]:
     """Iterate over the ``stim.Circuit`` by moments.
 
@@ -381,14 +386,11 @@ def iter_stim_circuit_without_repeat_by_moments(
     instructions. Note that ``stim.CircuitRepeatBlock`` instances are explicitly not
     supported and no such instance should appear in the provided circuit.
 
+    Each yielded :class:`Moment` owns an independent ``stim.Circuit`` instance,
+    so the moments can safely be collected before use.
+
     Args:
         circuit: circuit to iterate over. Should not contain any ``REPEAT`` block.
-        collected_before_use: if ``True``, the returned :class:`Moment` instances
-            will contain a copy of the temporary ``stim.Circuit`` instance
-            representing the moment. This is needed if the yielded
-            :class:`Moment` instances are not used directly because the
-            underlying ``stim.Circuit`` instance is cleared when resuming the
-            generator.
 
     Yields:
         :class`Moment` instances.
@@ -400,20 +402,16 @@ def iter_stim_circuit_without_repeat_by_moments(
             inserted such that instructions between two ``TICK`` instructions
             are always applied on disjoint sets of qubits.
     """
-    copy_func: Callable[[stim.Circuit], stim.Circuit] = (
-        (lambda c: c.copy()) if collected_before_use else (lambda c: c)
-    )
-    cur_moment = stim.Circuit()
-    for inst in circuit:
+    # Each moment is sliced out of the circuit by stim, which is cheaper than
+    # appending its instructions one by one to a new stim.Circuit instance.
+    start = 0
+    for index, inst in enumerate(circuit):
         if isinstance(inst, stim.CircuitRepeatBlock):
             raise TQECException(
                 "Found an instance of stim.CircuitRepeatBlock which is "
                 "explicitly not supported by this method."
             )
         elif inst.name == "TICK":
-            yield Moment(copy_func(cur_moment))
-            cur_moment.clear()
-        else:
-            cur_moment.append(inst)
-    # No need to copy the last moment
-    yield Moment(cur_moment)
+            yield Moment(circuit[start:index])
+            start = index + 1
+    yield Moment(circuit[start:])
@@ -137,9 +137,7 @@ class ScheduledCircuit:
                 "a ScheduledCircuit instance."
             )
         moments: list[Moment] = list(
-            iter_stim_circuit_without_repeat_by_moments(
-                circuit, collected_before_use=True
-            )
+            iter_stim_circuit_without_repeat_by_moments(circuit)
         )
         if not moments:
             return ScheduledCircuit.empty()
@@ -25,6 +25,7 @@ from tqec.compile.specs.base import (
     BlockBuilder,
     CubeSpec,
     PipeSpec,
+    Substitution,
     SubstitutionBuilder,
 )
 from tqec.compile.specs.library.css import CSS_BLOCK_BUILDER, CSS_SUBSTITUTION_BUILDER
@@ -35,7 +36,7 @@ from tqec.utils.noise_model import NoiseModel
 from tqec.plaquette.plaquette import Plaquettes, RepeatedPlaquettes
 from tqec.templates.base import Template
 from tqec.templates.layout import LayoutTemplate
-from tqec.utils.position import Direction3D, Position3D
+from tqec.utils.position import BlockPosition2D, Direction3D, Position3D
 from tqec.utils.scale import round_or_fail
 
 
@@ -89,7 +90,9 @@ class CompiledGraph:
                 Detectors are not computed and added to the circuit if this
                 argument is negative.
             detector_database: an instance to retrieve from / store in detectors
-                that are computed as part of the circuit generation.
+                that are computed as part of the circuit generation. If not
+                provided, a temporary database is still used so that identical
+                situations within the circuit are only computed once.
             only_use_database: if ``True``, only detectors from the database
                 will be used. An error will be raised if a situation that is not
                 registered in the database is encountered.
@@ -134,6 +137,10 @@ class CompiledGraph:
             start=cast(list[Plaquettes], []),
         )
         if manhattan_radius >= 0:
+            # Many situations repeat across the computation (e.g., the bulk of
+            # each memory block), so always deduplicate them through a database.
+            if detector_database is None and not only_use_database:
+                detector_database = DetectorDatabase()
             self._inplace_add_detectors_to_circuits(
                 flattened_circuits,
                 flattened_templates,
@@ -341,10 +348,19 @@ def compile_block_graph(
     block_graph = block_graph.shift_min_z_to_zero()
 
     # 1. Get the base compiled blocks before applying the substitution rules.
+    # Cubes sharing the same spec are only built once, whatever the block
+    # builder. Each cube still gets its own list of layers as the substitution
+    # rules update it in place.
+    base_blocks: dict[CubeSpec, CompiledBlock] = {}
     blocks: dict[Position3D, CompiledBlock] = {}
     for cube in block_graph.nodes:
         spec = cube_specs[cube]
-        blocks[cube.position] = block_builder(spec)
+        if spec not in base_blocks:
+            base_blocks[spec] = block_builder(spec)
+        base_block = base_blocks[spec]
+        blocks[cube.position] = CompiledBlock(
+            base_block.template, list(base_block.layers)
+        )
 
     # 2. Apply the substitution rules to the compiled blocks inplace.
     pipes = block_graph.edges
@@ -354,25 +370,28 @@ def compile_block_graph(
     # To keep the time-direction substitution rules from removing the extra resets
     # added by the space-direction substitution rules, we first apply the time-direction
     # substitution rules.
+    # Pipes sharing the same spec are only built once. Substitutions are only
+    # read when updating the layers, so they can be shared between pipes.
+    substitutions: dict[PipeSpec, Substitution] = {}
     for pipe in time_pipes + space_pipes:
         pos1, pos2 = pipe.u.position, pipe.v.position
         key = PipeSpec(cube_specs[pipe.u], cube_specs[pipe.v], pipe.kind)
-        substitution = substitution_builder(key)
+        if key not in substitutions:
+            substitutions[key] = substitution_builder(key)
+        substitution = substitutions[key]
         blocks[pos1].update_layers(substitution.src)
         blocks[pos2].update_layers(substitution.dst)
 
     # 3. Collect by time and create the blocks layout.
-    min_z = min(pos.z for pos in blocks.keys())
-    max_z = max(pos.z for pos in blocks.keys())
+    # Blocks are bucketed by z in a single pass over all the blocks.
+    blocks_by_z: dict[int, dict[BlockPosition2D, CompiledBlock]] = {}
+    for pos, block in blocks.items():
+        blocks_by_z.setdefault(pos.z, {})[
+            pos.as_2d().with_block_coordinate_system()
+        ] = block
+    min_z, max_z = min(blocks_by_z), max(blocks_by_z)
     layout_slices: list[BlockLayout] = [
-        BlockLayout(
-            {
-                pos.as_2d().with_block_coordinate_system(): block
-                for pos, block in blocks.items()
-                if pos.z == z
-            }
-        )
-        for z in range(min_z, max_z + 1)
+        BlockLayout(blocks_by_z.get(z, {})) for z in range(min_z, max_z + 1)
     ]
 
     # 4. Get the abstract observables to be included in the compiled circuit.
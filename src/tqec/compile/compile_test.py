@@ -3,8 +3,15 @@ from typing import Literal
 
 import pytest
 
+from tqec.compile.block import CompiledBlock
 from tqec.compile.compile import compile_block_graph
-from tqec.compile.specs.base import BlockBuilder, SubstitutionBuilder
+from tqec.compile.specs.base import (
+    BlockBuilder,
+    CubeSpec,
+    PipeSpec,
+    Substitution,
+    SubstitutionBuilder,
+)
 from tqec.compile.specs.library.css import CSS_BLOCK_BUILDER, CSS_SUBSTITUTION_BUILDER
 from tqec.compile.specs.library.zxxz import (
     ZXXZ_BLOCK_BUILDER,
@@ -23,11 +30,27 @@ SPECS: dict[str, tuple[BlockBuilder, SubstitutionBuilder]] = {
 }
 
 
+@pytest.fixture(scope="module")
+def check_distance(request: pytest.FixtureRequest) -> bool:
+    """Whether the tests below should check the distance of the circuits.
+
+    Computing the circuit distance is the most expensive check of the tests
+    below, so it is skipped when slow tests are deselected with
+    ``-m "not slow"``. Each circuit is compiled only once either way.
+    """
+    return "not slow" not in request.config.getoption("markexpr")
+
+
 @pytest.mark.parametrize(
     ("spec", "kind", "k"),
     itertools.product(SPECS.keys(), ("ZXZ", "ZXX", "XZX", "XZZ"), (1,)),
 )
-def test_compile_single_block_memory(spec: str, kind: str, k: int) -> None:
+def test_compile_single_block_memory(
+    spec: str,
+    kind: str,
+    k: int,
+    check_distance: bool,
+) -> None:
     d = 2 * k + 1
     g = BlockGraph("Single Block Memory Experiment")
     g.add_node(Cube(Position3D(0, 0, 0), ZXCube.from_str(kind)))
@@ -42,7 +65,8 @@ def test_compile_single_block_memory(spec: str, kind: str, k: int) -> None:
     )
 
     assert circuit.num_detectors == (d**2 - 1) * d
-    assert len(circuit.shortest_graphlike_error()) == d
+    if check_distance:
+        assert len(circuit.shortest_graphlike_error()) == d
 
 
 @pytest.mark.parametrize(
@@ -50,7 +74,10 @@ def test_compile_single_block_memory(spec: str, kind: str, k: int) -> None:
     itertools.product(SPECS.keys(), ("ZXZ", "ZXX", "XZX", "XZZ"), (1,)),
 )
 def test_compile_two_same_blocks_connected_in_time(
-    spec: str, kind: str, k: int
+    spec: str,
+    kind: str,
+    k: int,
+    check_distance: bool,
 ) -> None:
     d = 2 * k + 1
     g = BlockGraph("Two Same Blocks in Time Experiment")
@@ -74,7 +101,8 @@ def test_compile_two_same_blocks_connected_in_time(
     dem = circuit.detector_error_model()
     assert dem.num_detectors == (d**2 - 1) * 2 * d
     assert dem.num_observables == 1
-    assert len(dem.shortest_graphlike_error()) == d
+    if check_distance:
+        assert len(dem.shortest_graphlike_error()) == d
 
 
 @pytest.mark.parametrize(
@@ -91,7 +119,10 @@ def test_compile_two_same_blocks_connected_in_time(
     ),
 )
 def test_compile_two_same_blocks_connected_in_space(
-    spec: str, kinds: tuple[str, str], k: int
+    spec: str,
+    kinds: tuple[str, str],
+    k: int,
+    check_distance: bool,
 ) -> None:
     d = 2 * k + 1
     g = BlockGraph("Two Same Blocks in Space Experiment")
@@ -117,7 +148,8 @@ def test_compile_two_same_blocks_connected_in_space(
     dem = circuit.detector_error_model()
     assert dem.num_detectors == 2 * (d**2 - 1) + (d + 1 + 2 * (d**2 - 1)) * (d - 1)
     assert dem.num_observables == 1
-    assert len(dem.shortest_graphlike_error()) == d
+    if check_distance:
+        assert len(dem.shortest_graphlike_error()) == d
 
 
 @pytest.mark.parametrize(
@@ -134,7 +166,10 @@ def test_compile_two_same_blocks_connected_in_space(
     ),
 )
 def test_compile_L_shape_in_space_time(
-    spec: str, kinds: tuple[str, str], k: int
+    spec: str,
+    kinds: tuple[str, str],
+    k: int,
+    check_distance: bool,
 ) -> None:
     d = 2 * k + 1
     g = BlockGraph("L-shape Blocks Experiment")
@@ -167,7 +202,8 @@ def test_compile_L_shape_in_space_time(
         == 2 * (d**2 - 1) + (d + 1 + 2 * (d**2 - 1)) * (d - 1) + (d**2 - 1) * d
     )
     assert dem.num_observables == 1
-    assert len(dem.shortest_graphlike_error()) == d
+    if check_distance:
+        assert len(dem.shortest_graphlike_error()) == d
 
 
 @pytest.mark.parametrize(
@@ -179,7 +215,10 @@ def test_compile_L_shape_in_space_time(
     ),
 )
 def test_compile_logical_cnot(
-    spec: str, support_observable_basis: Literal["Z", "X"], k: int
+    spec: str,
+    support_observable_basis: Literal["Z", "X"],
+    k: int,
+    check_distance: bool,
 ) -> None:
     d = 2 * k + 1
     g = logical_cnot_block_graph(support_observable_basis)
@@ -196,4 +235,44 @@ def test_compile_logical_cnot(
 
     dem = circuit.detector_error_model()
     assert dem.num_observables == 3
-    assert len(dem.shortest_graphlike_error()) == d
+    if check_distance:
+        assert len(dem.shortest_graphlike_error()) == d
+
+
+@pytest.mark.parametrize("spec", SPECS.keys())
+def test_blocks_of_same_kind_share_layers(spec: str) -> None:
+    block_builder, _ = SPECS[spec]
+    cube_spec = CubeSpec(ZXCube.from_str("ZXZ"))
+    block1, block2 = block_builder(cube_spec), block_builder(cube_spec)
+    assert all(l1 is l2 for l1, l2 in zip(block1.layers, block2.layers))
+    # Substitutions replace the layers in place, so the lists must differ.
+    assert block1.layers is not block2.layers
+
+
+def test_blocks_are_built_once_per_cube_spec() -> None:
+    built_blocks: dict[CubeSpec, list[CompiledBlock]] = {}
+
+    def block_builder(spec: CubeSpec) -> CompiledBlock:
+        block = CSS_BLOCK_BUILDER(spec)
+        built_blocks.setdefault(spec, []).append(block)
+        return block
+
+    g = logical_cnot_block_graph("X")
+    compile_block_graph(g, block_builder, CSS_SUBSTITUTION_BUILDER)
+    assert all(len(blocks) == 1 for blocks in built_blocks.values())
+    assert len(built_blocks) < g.num_nodes
+    # Substitutions must not modify the layers of the shared blocks.
+    for spec, (block,) in built_blocks.items():
+        assert block.layers == CSS_BLOCK_BUILDER(spec).layers
+
+
+def test_substitutions_are_built_once_per_pipe_spec() -> None:
+    built_specs: list[PipeSpec] = []
+
+    def substitution_builder(spec: PipeSpec) -> Substitution:
+        built_specs.append(spec)
+        return CSS_SUBSTITUTION_BUILDER(spec)
+
+    g = logical_cnot_block_graph("X")
+    compile_block_graph(g, CSS_BLOCK_BUILDER, substitution_builder)
+    assert len(built_specs) == len(set(built_specs)) < g.num_edges
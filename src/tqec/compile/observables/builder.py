@@ -1,6 +1,6 @@
 """Provides helper functions to add observables to circuits."""
 
-from typing import Iterable
+from typing import Final, Iterable
 
 import stim
 
@@ -19,6 +19,16 @@ from tqec.utils.position import (
 )
 from tqec.utils.scale import round_or_fail
 
+# (cos(theta), sin(theta)) of the rotation mapping the stabilizers computed for
+# a cube connected towards X+ to the stabilizers of a cube connected towards the
+# given direction.
+_ROTATION_FROM_X_POSITIVE: Final[dict[SignedDirection3D, tuple[int, int]]] = {
+    SignedDirection3D(Direction3D.X, True): (1, 0),
+    SignedDirection3D(Direction3D.X, False): (-1, 0),
+    SignedDirection3D(Direction3D.Y, True): (0, 1),
+    SignedDirection3D(Direction3D.Y, False): (0, -1),
+}
+
 
 def inplace_add_observable(
     k: int,
@@ -242,16 +252,7 @@ def _get_bottom_stabilizer_cube_qubits(
     # ry = cy + b * (x - cx) + a * (y - cy)
     # in which (cx, cy) is the center of the block, a = cos(theta), b = sin(theta)
     # and theta is the angle of rotation.
-    a, b = 1, 0
-    match connect_to:
-        case SignedDirection3D(Direction3D.X, False):
-            a, b = -1, 0
-        case SignedDirection3D(Direction3D.Y, True):
-            a, b = 0, 1
-        case SignedDirection3D(Direction3D.Y, False):
-            a, b = 0, -1
-        case _:
-            pass
+    a, b = _ROTATION_FROM_X_POSITIVE.get(connect_to, (1, 0))
     cx, cy = cube_shape.x // 2, cube_shape.y // 2
     return [
         (
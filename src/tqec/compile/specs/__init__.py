@@ -10,3 +10,4 @@ from .library import CSS_BLOCK_BUILDER as CSS_BLOCK_BUILDER
 from .library import CSS_SUBSTITUTION_BUILDER as CSS_SUBSTITUTION_BUILDER
 from .library import ZXXZ_BLOCK_BUILDER as ZXXZ_BLOCK_BUILDER
 from .library import ZXXZ_SUBSTITUTION_BUILDER as ZXXZ_SUBSTITUTION_BUILDER
+from .warm_up import warm_up_builders as warm_up_builders
@@ -1,4 +1,6 @@
-from typing import Literal
+from collections.abc import Hashable
+from typing import Final, Literal, TypeVar
+from weakref import WeakKeyDictionary
 
 from tqec.compile.block import CompiledBlock
 from tqec.compile.specs.base import CubeSpec, PipeSpec, Substitution
@@ -13,6 +15,51 @@ from tqec.utils.position import Direction3D
 from tqec.utils.scale import LinearFunction
 
 _DEFAULT_BLOCK_REPETITIONS = LinearFunction(2, -1)
+# (data_init, data_meas, repetitions) for each layer of a pipe in space.
+_SPACE_PIPE_LAYERS: Final = (
+    (True, False, None),
+    (False, False, _DEFAULT_BLOCK_REPETITIONS),
+    (False, True, None),
+)
+# Side of the first cube that is substituted by a pipe in space. In `tqec`
+# library, the positive y-axis is the downward direction.
+_SPACE_PIPE_SUBSTITUTED_SIDE: Final[dict[Direction3D, PlaquetteSide]] = {
+    Direction3D.X: PlaquetteSide.RIGHT,
+    Direction3D.Y: PlaquetteSide.DOWN,
+}
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+# Arguments used to build a plaquette with a plaquette builder.
+_PlaquetteKey = tuple[
+    Literal["X", "Z"],
+    Basis | None,
+    Basis | None,
+    Literal["VERTICAL", "HORIZONTAL"],
+    PlaquetteSide | None,
+]
+# Plaquettes and layers of plaquettes built with each plaquette builder. They are
+# immutable and the same ones are requested for many cubes and pipes, so each of
+# them is only built once. The entries of a plaquette builder are dropped along
+# with the builder.
+_PLAQUETTES: Final[
+    WeakKeyDictionary[PlaquetteBuilder, dict[_PlaquetteKey, Plaquette]]
+] = WeakKeyDictionary()
+_LAYERS: Final[
+    WeakKeyDictionary[PlaquetteBuilder, dict[tuple[Hashable, ...], Plaquettes]]
+] = WeakKeyDictionary()
+
+
+def _get_memo(
+    memos: WeakKeyDictionary[PlaquetteBuilder, dict[_K, _V]],
+    builder: PlaquetteBuilder,
+) -> dict[_K, _V]:
+    """Returns the memo of ``builder`` in ``memos``, creating it if needed."""
+    try:
+        return memos.setdefault(builder, {})
+    except TypeError:
+        # builder cannot be weakly referenced, so nothing is memoized for it.
+        return {}
 
 
 def default_compiled_block_builder(
@@ -65,17 +112,47 @@ def _build_plaquette_for_different_basis(
     b1, b2 = ("X", "Z") if x_boundary_orientation == "HORIZONTAL" else ("Z", "X")
 
     def factory(b: Literal["X", "Z"]) -> Plaquette:
-        return builder(
-            basis=b,
-            data_initialization=temporal_basis if data_init else None,
-            data_measurement=temporal_basis if data_meas else None,
-            x_boundary_orientation=x_boundary_orientation,
-            init_meas_only_on_side=init_meas_only_on_side,
+        return _build_plaquette(
+            builder,
+            b,
+            temporal_basis if data_init else None,
+            temporal_basis if data_meas else None,
+            x_boundary_orientation,
+            init_meas_only_on_side,
         )
 
     return factory(b1), factory(b2)
 
 
+def _build_plaquette(
+    builder: PlaquetteBuilder,
+    basis: Literal["X", "Z"],
+    data_initialization: Basis | None,
+    data_measurement: Basis | None,
+    x_boundary_orientation: Literal["VERTICAL", "HORIZONTAL"],
+    init_meas_only_on_side: PlaquetteSide | None,
+) -> Plaquette:
+    """Build a plaquette with the provided builder, only once per set of
+    arguments."""
+    plaquettes = _get_memo(_PLAQUETTES, builder)
+    key: _PlaquetteKey = (
+        basis,
+        data_initialization,
+        data_measurement,
+        x_boundary_orientation,
+        init_meas_only_on_side,
+    )
+    if key not in plaquettes:
+        plaquettes[key] = builder(
+            basis=basis,
+            data_initialization=data_initialization,
+            data_measurement=data_measurement,
+            x_boundary_orientation=x_boundary_orientation,
+            init_meas_only_on_side=init_meas_only_on_side,
+        )
+    return plaquettes[key]
+
+
 def _build_plaquettes_for_rotated_surface_code(
     builder: PlaquetteBuilder,
     x_boundary_orientation: Literal["VERTICAL", "HORIZONTAL"],
@@ -88,7 +165,20 @@ def _build_plaquettes_for_rotated_surface_code(
     """Build the plaquettes for a rotated surface code.
 
     The plaquettes can be fit into the `QubitTemplate` by the corresponding indices.
+    The returned plaquettes are immutable and memoized per builder, so all the
+    blocks with the same kind share the same instances.
     """
+    layers = _get_memo(_LAYERS, builder)
+    key = (
+        "rotated_surface_code",
+        x_boundary_orientation,
+        temporal_basis,
+        data_init,
+        data_meas,
+        repetitions,
+    )
+    if key in layers:
+        return layers[key]
     p1, p2 = _build_plaquette_for_different_basis(
         builder,
         x_boundary_orientation,
@@ -111,6 +201,7 @@ def _build_plaquettes_for_rotated_surface_code(
     )
     if repetitions is not None:
         plaquettes = plaquettes.repeat(repetitions)
+    layers[key] = plaquettes
     return plaquettes
 
 
@@ -121,11 +212,13 @@ def _build_regular_block(
     repetitions: LinearFunction = _DEFAULT_BLOCK_REPETITIONS,
 ) -> CompiledBlock:
     """Build a compiled block for a regular cube."""
+    # The layers are cached and shared between blocks, but the list holding
+    # them is not: substitutions replace the layers of a block in place.
     layers = [
         _build_plaquettes_for_rotated_surface_code(
             builder,
             x_boundary_orientation,
-            temporal_basis=temporal_basis,
+            temporal_basis=temporal_basis if init or meas else None,
             data_init=init,
             data_meas=meas,
             repetitions=repeat,
@@ -171,7 +264,23 @@ def _build_plaquettes_for_space_regular_pipe(
     repetitions: LinearFunction | None = None,
 ) -> Plaquettes:
     """Build the plaquettes for a pipe connecting two regular cubes in
-    space."""
+    space.
+
+    The returned plaquettes are immutable and memoized per builder, so pipes
+    sharing the same layer parameters share the same instance.
+    """
+    layers = _get_memo(_LAYERS, builder)
+    key = (
+        "space_regular_pipe",
+        substitution_side,
+        x_boundary_orientation,
+        temporal_basis,
+        data_init,
+        data_meas,
+        repetitions,
+    )
+    if key in layers:
+        return layers[key]
     p1, p2 = _build_plaquette_for_different_basis(
         builder,
         x_boundary_orientation,
@@ -213,6 +322,7 @@ def _build_plaquettes_for_space_regular_pipe(
     )
     if repetitions is not None:
         plaquettes = plaquettes.repeat(repetitions)
+    layers[key] = plaquettes
     return plaquettes
 
 
@@ -238,12 +348,7 @@ def _build_substitution_in_space_with_regular_cubes(
     temporal_basis = pipe_type.z
     # No hadamard: the two cubes have the same orientation
     orientation = _get_x_boundary_orientation(pipe_spec.spec1.kind)
-    # In `tqec` library, the positive y-axis is the downward direction
-    substitute_side1 = (
-        PlaquetteSide.RIGHT
-        if pipe_spec.pipe_kind.direction == Direction3D.X
-        else PlaquetteSide.DOWN
-    )
+    substitute_side1 = _SPACE_PIPE_SUBSTITUTED_SIDE[pipe_spec.pipe_kind.direction]
     substitute_side2 = substitute_side1.opposite()
 
     def build_substitution(side: PlaquetteSide) -> dict[int, Plaquettes]:
@@ -252,18 +357,15 @@ def _build_substitution_in_space_with_regular_cubes(
                 plaquette_builder,
                 side,
                 orientation,
-                temporal_basis=temporal_basis,
+                # The temporal basis is only used for data-qubit resets and
+                # measurements. Dropping it otherwise lets the middle layer be
+                # shared between pipes with different temporal bases.
+                temporal_basis=temporal_basis if data_init or data_meas else None,
                 data_init=data_init,
                 data_meas=data_meas,
                 repetitions=repetitions,
             )
-            for i, (data_init, data_meas, repetitions) in enumerate(
-                [
-                    (True, False, None),
-                    (False, False, _DEFAULT_BLOCK_REPETITIONS),
-                    (False, True, None),
-                ]
-            )
+            for i, (data_init, data_meas, repetitions) in enumerate(_SPACE_PIPE_LAYERS)
         }
 
     return Substitution(
@@ -0,0 +1,51 @@
+from tqec.compile.block import CompiledBlock
+from tqec.compile.compile import compile_block_graph
+from tqec.compile.specs.base import CubeSpec, PipeSpec, Substitution
+from tqec.compile.specs.library.css import CSS_BLOCK_BUILDER, CSS_SUBSTITUTION_BUILDER
+from tqec.compile.specs.warm_up import warm_up_builders
+from tqec.gallery.logical_cnot import logical_cnot_block_graph
+
+
+def test_warm_up_builders() -> None:
+    cube_specs: list[CubeSpec] = []
+    pipe_specs: list[PipeSpec] = []
+
+    def block_builder(spec: CubeSpec) -> CompiledBlock:
+        cube_specs.append(spec)
+        return CSS_BLOCK_BUILDER(spec)
+
+    def substitution_builder(spec: PipeSpec) -> Substitution:
+        pipe_specs.append(spec)
+        return CSS_SUBSTITUTION_BUILDER(spec)
+
+    warm_up_builders(block_builder, substitution_builder)
+    assert {str(spec.kind) for spec in cube_specs} == {"ZXZ", "XZZ", "ZXX", "XZX"}
+    assert all(spec.spec1 == spec.spec2 for spec in pipe_specs)
+    assert {(str(spec.spec1.kind), str(spec.pipe_kind)) for spec in pipe_specs} == {
+        ("ZXZ", "OXZ"),
+        ("ZXZ", "ZXO"),
+        ("XZZ", "XOZ"),
+        ("XZZ", "XZO"),
+        ("ZXX", "ZOX"),
+        ("ZXX", "ZXO"),
+        ("XZX", "OZX"),
+        ("XZX", "XZO"),
+    }
+
+
+def test_warm_up_builders_covers_logical_cnot_blocks() -> None:
+    cube_specs: set[CubeSpec] = set()
+
+    def block_builder(spec: CubeSpec) -> CompiledBlock:
+        cube_specs.add(spec)
+        return CSS_BLOCK_BUILDER(spec)
+
+    def substitution_builder(spec: PipeSpec) -> Substitution:
+        return CSS_SUBSTITUTION_BUILDER(spec)
+
+    warm_up_builders(block_builder, substitution_builder)
+    warmed_up_cube_specs = set(cube_specs)
+    compile_block_graph(
+        logical_cnot_block_graph("X"), block_builder, substitution_builder
+    )
+    assert cube_specs == warmed_up_cube_specs
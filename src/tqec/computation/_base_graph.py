@@ -93,7 +93,11 @@ class ComputationGraph(Generic[_NODE, _EDGE]):
     @property
     def leaf_nodes(self) -> list[_NODE]:
         """Get the leaf nodes of the graph, i.e. the nodes with degree 1."""
-        return [node for node in self.nodes if self.get_degree(node.position) == 1]
+        return [
+            data[self._NODE_DATA_KEY]
+            for position, data in self._graph.nodes(data=True)
+            if len(self._graph.adj[position]) == 1
+        ]
 
     def _check_node_conflict(self, node: _NODE) -> None:
         """Check whether a new node can be added to the graph without conflict.
@@ -148,6 +152,10 @@ class ComputationGraph(Generic[_NODE, _EDGE]):
         self._check_node_conflict(v)
         self.add_node(u, check_conflict=False)
         self.add_node(v, check_conflict=False)
+        self._add_edge_unchecked(u, v, edge)
+
+    def _add_edge_unchecked(self, u: _NODE, v: _NODE, edge: _EDGE) -> None:
+        """Add an edge between two nodes already in the graph, without any check."""
         self._graph.add_edge(u.position, v.position, **{self._EDGE_DATA_KEY: edge})
 
     def has_edge_between(self, pos1: Position3D, pos2: Position3D) -> bool:
@@ -182,11 +190,13 @@ class ComputationGraph(Generic[_NODE, _EDGE]):
 
     def edges_at(self, position: Position3D) -> list[_EDGE]:
         """Get the edges incident to a position."""
-        if position not in self:
+        # The adjacency of a node maps each of its neighbours to the data of
+        # the edge connecting them, which avoids building an edge view.
+        if position not in self._graph:
             return []
         return [
             cast(_EDGE, data[self._EDGE_DATA_KEY])
-            for _, _, data in self._graph.edges(position, data=True)
+            for data in self._graph.adj[position].values()
         ]
 
     def copy(self) -> Self:
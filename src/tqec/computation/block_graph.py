@@ -5,7 +5,7 @@ from __future__ import annotations
 import pathlib
 from copy import deepcopy
 from io import BytesIO
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from tqec.computation._base_graph import ComputationGraph
 from tqec.computation.correlation import CorrelationSurface
@@ -230,24 +230,44 @@ class BlockGraph(ComputationGraph[Cube, Pipe]):
         minz = min(cube.position.z for cube in self.nodes)
         if minz == 0:
             return deepcopy(self)
+        # Shift each cube once, instead of once per incident pipe.
+        shifted_cubes = {
+            cube.position: Cube(cube.position.shift_by(dz=-minz), cube.kind, cube.label)
+            for cube in self.nodes
+        }
         new_graph = BlockGraph(self.name)
+        for cube in shifted_cubes.values():
+            new_graph.add_node(cube, check_conflict=False)
         for pipe in self.edges:
-            u, v = pipe.u, pipe.v
             new_graph.add_edge(
-                Cube(u.position.shift_by(dz=-minz), u.kind, u.label),
-                Cube(v.position.shift_by(dz=-minz), v.kind, v.label),
+                shifted_cubes[pipe.u.position],
+                shifted_cubes[pipe.v.position],
                 pipe.kind,
             )
         return new_graph
 
-    def find_correlation_surfaces(self) -> list[CorrelationSurface]:
+    def find_correlation_surfaces(
+        self,
+        *,
+        parallel: bool = False,
+        method: Literal["all", "generators"] = "all",
+    ) -> list[CorrelationSurface]:
         """Get the `~tqec.computation.correlation.CorrelationSurface`s from the corresponding
         ZXGraph of the block graph.
 
+        Args:
+            parallel: Whether to explore the leaves in parallel with a pool of
+                worker processes when ``method`` is ``"all"``. Default to ``False``.
+            method: ``"all"`` to enumerate all the correlation surfaces, or
+                ``"generators"`` to only return a generating set of them. Default
+                to ``"all"``.
+
         Returns:
             The list of correlation surfaces.
         """
-        return self.to_zx_graph().find_correlation_surfaces()
+        return self.to_zx_graph().find_correlation_surfaces(
+            parallel=parallel, method=method
+        )
 
     def rotate(
         self,
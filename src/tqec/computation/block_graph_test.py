@@ -151,11 +151,13 @@ def test_shift_min_z_to_zero() -> None:
         Cube(Position3D(0, 0, 0), ZXCube.from_str("ZXZ")),
         PipeKind.from_str("ZXO"),
     )
+    g.add_node(Cube(Position3D(3, 3, 2), ZXCube.from_str("ZXZ")))
     shifted = g.shift_min_z_to_zero()
-    assert shifted.num_nodes == 3
+    assert shifted.num_nodes == 4
     assert shifted.num_edges == 2
     assert {cube.position for cube in shifted.nodes} == {
         Position3D(0, 0, 0),
         Position3D(1, 0, 0),
         Position3D(0, 0, 1),
+        Position3D(3, 3, 3),
     }
@@ -4,8 +4,15 @@ the functions to find the correlation surfaces in the ZX graph."""
 from __future__ import annotations
 
 import itertools
+import os
 from collections.abc import Iterable
 from dataclasses import dataclass, field
+from functools import partial
+from multiprocessing import Pool
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
 
 from tqec.computation.zx_graph import ZXEdge, ZXGraph, ZXKind, ZXNode
 from tqec.utils.exceptions import TQECException
@@ -129,12 +136,24 @@ class CorrelationSurface:
 
 def find_correlation_surfaces(
     zx_graph: ZXGraph,
+    *,
+    parallel: bool = False,
+    method: Literal["all", "generators"] = "all",
 ) -> list[CorrelationSurface]:
-    """Find all the
+    """Find the
     :py:class:`~tqec.computation.correlation.CorrelationSurface` in a ZX graph.
 
-    Starting from each leaf node in the graph, the function explores how can the X/Z logical observable
-    move through the graph to form a correlation surface:
+    The spiders in the graph pose parity constraints on the logical observables
+    supported on the incident edges. Firstly, we define two types of nodes in the graph:
+
+    - *broadcast node:* A node that has seen logical observable with basis opposite to its own basis.
+      A logical observable needs to be broadcasted to all the neighbors of the node.
+    - *passthrough node:* A node that has seen logical observable with the same basis as its own basis.
+      A logical observable needs to be only supported on an even number of edges connected to the node.
+
+    By default, the function enumerates all the correlation surfaces starting from each leaf node in
+    the graph, exploring how can the X/Z logical observable move through the graph to form a
+    correlation surface:
 
     - For a X/Z kind leaf node, it can only support the logical observable with the opposite type. Only
       a single type of logical observable is explored from the leaf node.
@@ -144,23 +163,35 @@ def find_correlation_surfaces(
     - For the port node, it can support any type of logical observable. Both X and Z type logical observable
       are explored from the port node.
 
-    The function uses a flood fill like recursive algorithm to find the correlation surface in the graph.
-    Firstly, we define two types of nodes in the graph:
-
-    - *broadcast node:* A node that has seen logical observable with basis opposite to its own basis.
-      A logical observable needs to be broadcasted to all the neighbors of the node.
-    - *passthrough node:* A node that has seen logical observable with the same basis as its own basis.
-      A logical observable needs to be only supported on an even number of edges connected to the node.
-
-    The algorithm starts from a set of frontier nodes and greedily expands the correlation
-    surface until no more broadcast nodes are in the frontier. Then it explore the
-    passthrough nodes, and select even number of edges to be included in the surface. If
-    no such selection can be made, the search is pruned. For different choices, the algorithm
-    recursively explores the next frontier until the search is completed. Finally, the branches
-    at different nodes are produced to form the correlation surface.
+    The search uses a flood fill like recursive algorithm. It starts from a set of frontier
+    nodes and greedily expands the correlation surface until no more broadcast nodes are in the
+    frontier. Then it explore the passthrough nodes, and select even number of edges to be included
+    in the surface. If no such selection can be made, the search is pruned. For different choices,
+    the algorithm recursively explores the next frontier until the search is completed. Finally,
+    the branches at different nodes are produced to form the correlation surface. The number of
+    branches grows exponentially with the size of the graph.
+
+    The searches started from each leaf are independent of the others. If ``parallel`` is
+    ``True``, the searches are distributed over a pool of worker processes.
+
+    If ``method`` is ``"generators"``, a binary variable is instead assigned to each pair of edge
+    and X/Z logical observable, and the constraints above are encoded as linear equations over
+    GF(2). The solutions of the system form a vector space, and the function returns a basis of
+    this space in polynomial time. Solutions that do not touch any leaf node, i.e. closed surfaces
+    inside the graph, are quotiented out as they do not correlate any input/output of the
+    computation. Every correlation surface in the graph is then, up to such closed surfaces, a
+    product of the returned correlation surfaces. The generating set is usually smaller than the
+    list of all the correlation surfaces, and its surfaces are ordered differently.
 
     Args:
         zx_graph: The ZX graph to find the correlation surfaces.
+        parallel: Whether to explore the leaves in parallel with a pool of worker
+            processes when ``method`` is ``"all"``. This is only beneficial for large
+            graphs, where the cost of the search dominates the cost of spawning the
+            processes. Default to ``False``.
+        method: ``"all"`` to enumerate all the correlation surfaces with the flood
+            fill like search, or ``"generators"`` to only return a generating set of
+            them. Default to ``"all"``.
 
     Returns:
         A list of `CorrelationSurface` in the graph.
@@ -181,37 +212,247 @@ def find_correlation_surfaces(
             "The graph must contain at least one leaf node to find correlation surfaces."
         )
     correlation_surfaces: set[CorrelationSurface] = set()
-    for leaf in leaves:
-        correlation_surfaces.update(
-            _find_correlation_surfaces_from_leaf(zx_graph, leaf)
-        )
+    if method == "generators":
+        correlation_surfaces.update(_find_correlation_surfaces_generators(zx_graph))
+    elif not _has_correlation_surface(zx_graph):
+        # Skip the exponential search if the constraints only have the trivial solution
+        return []
+    elif parallel:
+        # There is no point in spawning more worker processes than leaves.
+        with Pool(min(len(leaves), os.cpu_count() or 1)) as pool:
+            correlation_surfaces.update(
+                itertools.chain.from_iterable(
+                    pool.starmap(
+                        partial(_find_correlation_surfaces_from_leaf, zx_graph),
+                        _get_leaves_with_forbidden_by_precedence(leaves),
+                    )
+                )
+            )
+    else:
+        for leaf, forbidden in _get_leaves_with_forbidden_by_precedence(leaves):
+            correlation_surfaces.update(
+                _find_correlation_surfaces_from_leaf(zx_graph, leaf, forbidden)
+            )
     # sort the correlation surfaces to make the result deterministic
     return sorted(correlation_surfaces, key=lambda x: sorted(x.span))
 
 
+def _find_correlation_surfaces_generators(
+    zx_graph: ZXGraph,
+) -> list[CorrelationSurface]:
+    """Find a generating set of the correlation surfaces touching the leaf
+    nodes by solving the parity constraints over GF(2)."""
+    edges = sorted(zx_graph.edges)
+    parity_check_matrix = _build_parity_check_matrix(zx_graph, edges)
+    solutions = _gf2_null_space(parity_check_matrix)
+
+    # Quotient out the closed surfaces by only pivoting on the leaf variables.
+    leaf_positions = {leaf.position for leaf in zx_graph.leaf_nodes}
+    leaf_variables = [
+        2 * i + offset
+        for i, edge in enumerate(edges)
+        if edge.u.position in leaf_positions or edge.v.position in leaf_positions
+        for offset in (0, 1)
+    ]
+    generators, _ = _gf2_row_reduce(solutions, leaf_variables)
+
+    correlation_surfaces: list[CorrelationSurface] = []
+    for generator in generators:
+        span: list[ZXEdge] = []
+        for variable in np.flatnonzero(generator):
+            edge = edges[variable // 2]
+            kind = ZXKind.X if variable % 2 == 0 else ZXKind.Z
+            other_kind = kind.with_zx_flipped() if edge.has_hadamard else kind
+            span.append(
+                ZXEdge(
+                    ZXNode(edge.u.position, kind),
+                    ZXNode(edge.v.position, other_kind),
+                    edge.has_hadamard,
+                )
+            )
+        correlation_surfaces.append(CorrelationSurface.from_span(zx_graph, span))
+    return correlation_surfaces
+
+
+def _build_parity_check_matrix(
+    zx_graph: ZXGraph, edges: list[ZXEdge]
+) -> npt.NDArray[np.uint8]:
+    """Encode the constraints posed by the nodes on the logical observables as
+    a binary matrix.
+
+    The variable ``2 * i`` (resp. ``2 * i + 1``) indicates whether the logical X
+    (resp. Z) observable, seen from the ``u`` node of ``edges[i]``, is supported
+    on that edge. Each row of the returned matrix is a parity constraint on
+    these variables.
+    """
+    edge_indices = {edge: i for i, edge in enumerate(edges)}
+    constraints: list[list[int]] = []
+    for node in zx_graph.nodes:
+        if node.is_port:
+            continue
+        incident_edges = [
+            (edge_indices[edge], edge) for edge in zx_graph.edges_at(node.position)
+        ]
+        if node.is_y_node:
+            constraints.extend(
+                [
+                    _get_variable_index(i, edge, node.position, ZXKind.X),
+                    _get_variable_index(i, edge, node.position, ZXKind.Z),
+                ]
+                for i, edge in incident_edges
+            )
+            continue
+        # passthrough: even parity on the incident edges
+        constraints.append(
+            [
+                _get_variable_index(i, edge, node.position, node.kind)
+                for i, edge in incident_edges
+            ]
+        )
+        # broadcast: either all or none of the incident edges
+        broadcast_variables = [
+            _get_variable_index(i, edge, node.position, node.kind.with_zx_flipped())
+            for i, edge in incident_edges
+        ]
+        constraints.extend([a, b] for a, b in itertools.pairwise(broadcast_variables))
+
+    num_variables = 2 * len(edges)
+    parity_check_matrix = np.zeros((len(constraints), num_variables), dtype=np.uint8)
+    for row, variables in enumerate(constraints):
+        parity_check_matrix[row, variables] = 1
+    return parity_check_matrix
+
+
+def _has_correlation_surface(zx_graph: ZXGraph) -> bool:
+    """Check whether there exists any non-trivial solution to the parity
+    constraints of the graph, i.e. the parity check matrix is not full rank."""
+    parity_check_matrix = _build_parity_check_matrix(zx_graph, sorted(zx_graph.edges))
+    _, pivots = _gf2_row_reduce(parity_check_matrix)
+    return bool(len(pivots) < parity_check_matrix.shape[1])
+
+
+def _get_variable_index(
+    edge_index: int, edge: ZXEdge, position: Position3D, kind: ZXKind
+) -> int:
+    """Get the index of the variable representing the logical observable of
+    the given kind, seen from the node at the given position, on the edge."""
+    if edge.has_hadamard and position == edge.v.position:
+        kind = kind.with_zx_flipped()
+    return 2 * edge_index + (0 if kind == ZXKind.X else 1)
+
+
+def _gf2_row_reduce(
+    matrix: npt.NDArray[np.uint8], pivot_columns: Iterable[int] | None = None
+) -> tuple[npt.NDArray[np.uint8], list[int]]:
+    """Compute the reduced row echelon form of a binary matrix over GF(2).
+
+    Args:
+        matrix: The binary matrix to reduce.
+        pivot_columns: The columns that can be used as pivots, in order. Default
+            to all the columns of the matrix.
+
+    Returns:
+        The rows of the reduced matrix that have a pivot, and the list of pivot
+        columns. If ``pivot_columns`` does not contain all the columns, the rows
+        that are zero on ``pivot_columns`` are discarded.
+    """
+    reduced = matrix.copy()
+    if pivot_columns is None:
+        pivot_columns = range(matrix.shape[1])
+    pivots: list[int] = []
+    rank = 0
+    for column in pivot_columns:
+        if rank == reduced.shape[0]:
+            break
+        candidates = np.flatnonzero(reduced[rank:, column])
+        if candidates.size == 0:
+            continue
+        pivot_row = rank + candidates[0]
+        reduced[[rank, pivot_row]] = reduced[[pivot_row, rank]]
+        rows_to_update = np.flatnonzero(reduced[:, column])
+        rows_to_update = rows_to_update[rows_to_update != rank]
+        reduced[rows_to_update] ^= reduced[rank]
+        pivots.append(column)
+        rank += 1
+    return reduced[:rank], pivots
+
+
+def _gf2_null_space(matrix: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint8]:
+    """Compute a basis of the null space of a binary matrix over GF(2).
+
+    Returns:
+        A binary matrix whose rows form a basis of the null space.
+    """
+    num_columns = matrix.shape[1]
+    reduced, pivots = _gf2_row_reduce(matrix)
+    pivot_set = set(pivots)
+    free_columns = [c for c in range(num_columns) if c not in pivot_set]
+    basis = np.zeros((len(free_columns), num_columns), dtype=np.uint8)
+    for i, column in enumerate(free_columns):
+        basis[i, column] = 1
+        basis[i, pivots] = reduced[:, column]
+    return basis
+
+
+def _get_leaves_with_forbidden_by_precedence(
+    leaves: Iterable[ZXNode],
+) -> list[tuple[ZXNode, frozenset[Position3D]]]:
+    """Order the leaves and pair each one with the positions of the leaves
+    preceding it.
+
+    The search started from a leaf finds all the correlation surfaces touching
+    that leaf. A surface touching several leaves would then be found once per
+    leaf it touches. To enumerate each surface only once, the search started
+    from a leaf is forbidden to reach any leaf that precedes it: the surfaces
+    touching a preceding leaf have already been found by the search started
+    from that leaf.
+
+    This only holds if none of the leaves is a Y node: the surfaces with a Y
+    observable on a leaf are built as products of X and Z spans, and are not
+    necessarily found again from the other leaves they touch. In that case,
+    no leaf is forbidden.
+    """
+    ordered_leaves = sorted(leaves, key=lambda leaf: leaf.position)
+    if any(leaf.is_y_node for leaf in ordered_leaves):
+        return [(leaf, frozenset()) for leaf in ordered_leaves]
+    return [
+        (leaf, frozenset(n.position for n in ordered_leaves[:i]))
+        for i, leaf in enumerate(ordered_leaves)
+    ]
+
+
 def _find_correlation_surfaces_from_leaf(
     zx_graph: ZXGraph,
     leaf: ZXNode,
+    forbidden: frozenset[Position3D] = frozenset(),
 ) -> list[CorrelationSurface]:
     """Find the correlation surfaces starting from a leaf node in the ZX
-    graph."""
+    graph, excluding the surfaces that touch any of the ``forbidden``
+    positions."""
     # Z/X type node can only support the correlation surface with the opposite type.
     if leaf.is_zx_node:
         spans = (
             _find_spans_with_flood_fill(
-                zx_graph, {ZXNode(leaf.position, leaf.kind.with_zx_flipped())}, set()
+                zx_graph,
+                {ZXNode(leaf.position, leaf.kind.with_zx_flipped())},
+                set(),
+                forbidden,
             )
             or []
         )
         return _construct_compatible_correlation_surfaces(zx_graph, spans)
 
     x_spans = (
-        _find_spans_with_flood_fill(zx_graph, {ZXNode(leaf.position, ZXKind.X)}, set())
+        _find_spans_with_flood_fill(
+            zx_graph, {ZXNode(leaf.position, ZXKind.X)}, set(), forbidden
+        )
         or []
     )
 
     z_spans = (
-        _find_spans_with_flood_fill(zx_graph, {ZXNode(leaf.position, ZXKind.Z)}, set())
+        _find_spans_with_flood_fill(
+            zx_graph, {ZXNode(leaf.position, ZXKind.Z)}, set(), forbidden
+        )
         or []
     )
 
@@ -276,9 +517,16 @@ def _find_spans_with_flood_fill(
     zx_graph: ZXGraph,
     frontier: set[ZXNode],
     current_span: set[ZXEdge],
+    forbidden: frozenset[Position3D] = frozenset(),
 ) -> list[frozenset[ZXEdge]] | None:
     """Find the correlation spans in the ZX graph using the flood fill like
-    algorithm."""
+    algorithm.
+
+    The search is pruned as soon as the span reaches one of the ``forbidden``
+    positions, as the span can only grow during the search.
+    """
+    if any(node.position in forbidden for node in frontier):
+        return None
     # The ZX node kind mismatches the logical observable basis, then we can flood
     # through(broadcast) all the edges connected to the current node.
     # Greedily flood through the edges until encountering the passthrough node.
@@ -291,6 +539,8 @@ def _find_spans_with_flood_fill(
                 continue
             u, v = correlation_edge
             next_correlation_node = u if v == correlation_node else v
+            if next_correlation_node.position in forbidden:
+                return None
             frontier.add(next_correlation_node)
             current_span.add(correlation_edge)
             if not _match_at(zx_graph, next_correlation_node):
@@ -342,7 +592,9 @@ def _find_spans_with_flood_fill(
         for nodes, edges in product:
             product_frontier.update(nodes)
             product_span.update(edges)
-        spans = _find_spans_with_flood_fill(zx_graph, product_frontier, product_span)
+        spans = _find_spans_with_flood_fill(
+            zx_graph, product_frontier, product_span, forbidden
+        )
         if spans is not None:
             final_spans.extend(spans)
 
@@ -1,7 +1,16 @@
+import functools
+import itertools
+import operator
+from typing import Literal
+
 import pytest
 
-from tqec.computation.correlation import CorrelationSurface
+from tqec.computation.correlation import (
+    CorrelationSurface,
+    _find_correlation_surfaces_from_leaf,
+)
 from tqec.computation.zx_graph import ZXEdge, ZXGraph, ZXKind, ZXNode
+from tqec.gallery.logical_cnot import logical_cnot_zx_graph
 from tqec.gallery.solo_node import solo_node_zx_graph
 from tqec.utils.position import Position3D
 
@@ -39,13 +48,16 @@ def test_correlation_two_xz_nodes(kind: ZXKind, label_u: str | None) -> None:
     ]
 
 
-def test_correlation_two_xz_nodes_impossible() -> None:
+@pytest.mark.parametrize("method", ["all", "generators"])
+def test_correlation_two_xz_nodes_impossible(
+    method: Literal["all", "generators"],
+) -> None:
     g = ZXGraph()
     g.add_edge(
         ZXNode(Position3D(0, 0, 0), ZXKind.X),
         ZXNode(Position3D(0, 0, 1), ZXKind.Z),
     )
-    assert g.find_correlation_surfaces() == []
+    assert g.find_correlation_surfaces(method=method) == []
 
 
 def test_correlation_hadamard() -> None:
@@ -216,3 +228,75 @@ def test_correlation_four_node_circle() -> None:
     assert correlation_surfaces[0].external_stabilizer == {"p1": "X", "p2": "X"}
     assert correlation_surfaces[1].external_stabilizer == {"p1": "Z", "p2": "Z"}
     assert correlation_surfaces[2].external_stabilizer == {"p1": "Z", "p2": "Z"}
+
+
+def test_correlation_parallel_search() -> None:
+    g = logical_cnot_zx_graph("OPEN")
+    assert g.find_correlation_surfaces(parallel=True) == g.find_correlation_surfaces()
+
+
+@pytest.mark.parametrize("port_kind", ["X", "Z", "OPEN"])
+def test_correlation_pruned_search_from_leaves(
+    port_kind: Literal["X", "Z", "OPEN"],
+) -> None:
+    g = logical_cnot_zx_graph(port_kind)
+    # Searching from every leaf without forbidding any of them finds the
+    # same surfaces, only with duplicates.
+    unpruned = {
+        surface
+        for leaf in g.leaf_nodes
+        for surface in _find_correlation_surfaces_from_leaf(g, leaf)
+    }
+    assert set(g.find_correlation_surfaces()) == unpruned
+
+
+@pytest.mark.parametrize(
+    ("port_kind", "num_generators"), [("X", 2), ("Z", 2), ("OPEN", 4)]
+)
+def test_correlation_generators_span_all_surfaces(
+    port_kind: Literal["X", "Z", "OPEN"], num_generators: int
+) -> None:
+    g = logical_cnot_zx_graph(port_kind)
+    generators = g.find_correlation_surfaces(method="generators")
+    assert len(generators) == num_generators
+    # Every enumerated surface is a product of the generators
+    products = {
+        functools.reduce(operator.xor, (s.span for s in subset))
+        for n in range(1, num_generators + 1)
+        for subset in itertools.combinations(generators, n)
+    }
+    assert all(surface.span in products for surface in g.find_correlation_surfaces())
+
+
+def test_correlation_generators_ignore_closed_surfaces() -> None:
+    g = ZXGraph()
+    g.add_edge(
+        ZXNode(Position3D(0, -1, 0), ZXKind.P, "p1"),
+        ZXNode(Position3D(0, 0, 0), ZXKind.Z),
+    )
+    g.add_edge(
+        ZXNode(Position3D(0, 0, 0), ZXKind.Z),
+        ZXNode(Position3D(0, 1, 0), ZXKind.P, "p2"),
+    )
+    g.add_edge(
+        ZXNode(Position3D(0, 0, 0), ZXKind.Z),
+        ZXNode(Position3D(1, 0, 0), ZXKind.Z),
+    )
+    g.add_edge(
+        ZXNode(Position3D(1, 0, 0), ZXKind.Z),
+        ZXNode(Position3D(1, 0, 1), ZXKind.Z),
+    )
+    g.add_edge(
+        ZXNode(Position3D(1, 0, 1), ZXKind.Z),
+        ZXNode(Position3D(0, 0, 1), ZXKind.Z),
+    )
+    g.add_edge(
+        ZXNode(Position3D(0, 0, 1), ZXKind.Z),
+        ZXNode(Position3D(0, 0, 0), ZXKind.Z),
+    )
+    correlation_surfaces = g.find_correlation_surfaces(method="generators")
+    assert len(correlation_surfaces) == 2
+    assert [cs.external_stabilizer for cs in correlation_surfaces] == [
+        {"p1": "X", "p2": "X"},
+        {"p1": "Z", "p2": "Z"},
+    ]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import astuple, dataclass
+from functools import cache
 
 from tqec.computation.zx_graph import ZXKind, ZXNode
 from tqec.utils.enums import Basis
@@ -14,6 +15,8 @@ from tqec.utils.position import Direction3D, Position3D
 class CubeKind(ABC):
     """Base class for the kinds of cubes in the block graph."""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_zx_kind(self) -> ZXKind:
         """Return the corresponding
@@ -25,7 +28,7 @@ class CubeKind(ABC):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZXCube(CubeKind):
     """The kind of cubes consisting of only X or Z basis boundaries.
 
@@ -66,6 +69,7 @@ class ZXCube(CubeKind):
         return [ZXCube.from_str(s) for s in ["ZXZ", "XZZ", "ZXX", "XZX", "XXZ", "ZZX"]]
 
     @staticmethod
+    @cache
     def from_str(string: str) -> ZXCube:
         """Create a cube kind from the string representation.
 
@@ -119,6 +123,8 @@ class Port(CubeKind):
     invisible when visualizing the computation model.
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "PORT"
 
@@ -135,6 +141,8 @@ class Port(CubeKind):
 class YCube(CubeKind):
     """Cube kind representing the Y-basis initialization/measurements."""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "Y"
 
@@ -148,7 +156,7 @@ class YCube(CubeKind):
         return isinstance(other, YCube)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Cube:
     """A fundamental building block of the logical computation.
 
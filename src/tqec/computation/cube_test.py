@@ -18,6 +18,7 @@ def test_zx_cube_kind() -> None:
     assert kind.get_basis_along(Direction3D.X) == Basis.Z
     assert kind.get_basis_along(Direction3D.Y) == Basis.X
     assert kind.get_basis_along(Direction3D.Z) == Basis.Z
+    assert ZXCube.from_str("ZXZ") is kind
 
     assert len(ZXCube.all_kinds()) == 6
 
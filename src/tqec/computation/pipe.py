@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 from typing import Generator
 
 from tqec.computation.cube import Cube, ZXCube
@@ -11,7 +12,7 @@ from tqec.utils.exceptions import TQECException
 from tqec.utils.position import Direction3D
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipeKind:
     """The kind of a pipe in the block graph.
 
@@ -51,6 +52,7 @@ class PipeKind:
         ) + ("H" if self.has_hadamard else "")
 
     @staticmethod
+    @cache
     def from_str(string: str) -> PipeKind:
         """Create a pipe kind from the string representation.
 
@@ -145,7 +147,7 @@ class PipeKind:
         return PipeKind.from_str("".join(bases_str))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Pipe:
     """A block connecting two :py:class:`~tqec.computation.cube.Cube` objects.
 
@@ -24,6 +24,7 @@ def test_pipe_kind() -> None:
     assert kind.get_basis_along(Direction3D.Y) == Basis.X
     assert kind.get_basis_along(Direction3D.Z, False) == Basis.Z
     assert kind.is_spatial
+    assert PipeKind.from_str("OXZ") is kind
 
     kind = PipeKind.from_str("XZOH")
     assert str(kind) == "XZOH"
@@ -3,18 +3,19 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Generator
+from typing import TYPE_CHECKING, Final, Generator, Literal
 
 import networkx as nx
+import numpy as np
+import numpy.typing as npt
 from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d.axes3d import Axes3D
 
 from tqec.computation._base_graph import ComputationGraph
 from tqec.utils.exceptions import TQECException
 from tqec.utils.position import Direction3D, Position3D
-from tqec.utils.scale import round_or_fail
 
 if TYPE_CHECKING:
     from tqec.computation.block_graph import BlockGraph
@@ -52,7 +53,7 @@ class ZXKind(Enum):
         return self.value < other.value
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class ZXNode:
     """A node in the ZX graph.
 
@@ -94,7 +95,7 @@ class ZXNode:
         return f"{self.kind}{self.position}"
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class ZXEdge:
     """An edge connecting two neighboring nodes in the ZX graph.
 
@@ -113,6 +114,7 @@ class ZXEdge:
     u: ZXNode
     v: ZXNode
     has_hadamard: bool = False
+    _direction: Direction3D = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         u, v = self.u, self.v
@@ -124,16 +126,21 @@ class ZXEdge:
         if self.u.position > self.v.position:
             object.__setattr__(self, "u", v)
             object.__setattr__(self, "v", u)
+        # The direction is queried a lot during the conversion to a block graph
+        # and never changes, so it is computed once.
+        up, vp = u.position, v.position
+        if up.x != vp.x:
+            direction = Direction3D.X
+        elif up.y != vp.y:
+            direction = Direction3D.Y
+        else:
+            direction = Direction3D.Z
+        object.__setattr__(self, "_direction", direction)
 
     @property
     def direction(self) -> Direction3D:
         """3D direction of the edge."""
-        u, v = self.u.position, self.v.position
-        if u.x != v.x:
-            return Direction3D.X
-        if u.y != v.y:
-            return Direction3D.Y
-        return Direction3D.Z
+        return self._direction
 
     def __iter__(self) -> Generator[ZXNode]:
         yield self.u
@@ -276,36 +283,36 @@ class ZXGraph(ComputationGraph[ZXNode, ZXEdge]):
 
         return convert_zx_graph_to_block_graph(self, name)
 
-    def find_correlation_surfaces(self) -> list[CorrelationSurface]:
-        """Find all the
+    def find_correlation_surfaces(
+        self,
+        *,
+        parallel: bool = False,
+        method: Literal["all", "generators"] = "all",
+    ) -> list[CorrelationSurface]:
+        """Find the
         :py:class:`~tqec.computation.correlation.CorrelationSurface` in a ZX
         graph.
 
-        Starting from each leaf node in the graph, the function explores how can the X/Z logical observable
-        move through the graph to form a correlation surface:
-
-        - For a X/Z kind leaf node, it can only support the logical observable with the opposite type. Only
-          a single type of logical observable is explored from the leaf node.
-        - For a Y kind leaf node, it can only support the Y logical observable, i.e. the presence of
-          both X and Z logical observable. Both X and Z type logical observable are explored from the leaf node.
-          And the two correlation surfaces are combined to form the Y type correlation surface.
-        - For the port node, it can support any type of logical observable. Both X and Z type logical observable
-          are explored from the port node.
+        By default, all the correlation surfaces are enumerated with a flood
+        fill like search starting from each leaf node in the graph. The runtime
+        of this search grows exponentially with the size of the graph.
 
-        The function uses a flood fill like recursive algorithm to find the correlation surface in the graph.
-        Firstly, we define two types of nodes in the graph:
+        If ``method`` is ``"generators"``, the parity constraints posed by the
+        spiders on the logical observables are instead encoded as linear
+        equations over GF(2), and a generating set of the correlation surfaces
+        touching the leaf nodes is computed in polynomial time. Every correlation
+        surface in the graph is, up to closed surfaces not touching any leaf
+        node, a product of the returned surfaces.
 
-        - *broadcast node:* A node that has seen logical observable with basis opposite to its own basis.
-          A logical observable needs to be broadcasted to all the neighbors of the node.
-        - *passthrough node:* A node that has seen logical observable with the same basis as its own basis.
-          A logical observable needs to be only supported on an even number of edges connected to the node.
+        See :py:func:`~tqec.computation.correlation.find_correlation_surfaces`
+        for more details.
 
-        The algorithm starts from a set of frontier nodes and greedily expands the correlation
-        surface until no more broadcast nodes are in the frontier. Then it explore the
-        passthrough nodes, and select even number of edges to be included in the surface. If
-        no such selection can be made, the search is pruned. For different choices, the algorithm
-        recursively explores the next frontier until the search is completed. Finally, the branches
-        at different nodes are produced to form the correlation surface.
+        Args:
+            parallel: Whether to explore the leaves in parallel with a pool of
+                worker processes when ``method`` is ``"all"``. Default to ``False``.
+            method: ``"all"`` to enumerate all the correlation surfaces, or
+                ``"generators"`` to only return a generating set of them. Default
+                to ``"all"``.
 
         Returns:
             A list of `CorrelationSurface` in the graph.
@@ -315,7 +322,7 @@ class ZXGraph(ComputationGraph[ZXNode, ZXEdge]):
         """
         from tqec.computation.correlation import find_correlation_surfaces
 
-        return find_correlation_surfaces(self)
+        return find_correlation_surfaces(self, parallel=parallel, method=method)
 
     def draw(
         self,
@@ -368,10 +375,13 @@ class ZXGraph(ComputationGraph[ZXNode, ZXEdge]):
         Raises:
             TQECException: If the invariants are not satisfied.
         """
-        if nx.number_connected_components(self._graph) != 1:
+        # A single traversal from any node is enough to check connectivity,
+        # there is no need to enumerate all the connected components.
+        if self.num_nodes == 0 or not nx.is_connected(self._graph):
             raise TQECException("The ZX graph must be a single connected component.")
-        for node in self.nodes:
-            if not node.is_zx_node and self.get_degree(node.position) != 1:
+        for position, data in self._graph.nodes(data=True):
+            node: ZXNode = data[self._NODE_DATA_KEY]
+            if not node.is_zx_node and len(self._graph.adj[position]) != 1:
                 raise TQECException("The port/Y node must be a leaf node.")
 
     def rotate(
@@ -397,28 +407,61 @@ class ZXGraph(ComputationGraph[ZXNode, ZXEdge]):
         if n == 0:
             return self.copy()
 
-        import numpy as np
-        from scipy.spatial.transform import Rotation as R
+        rotation_matrix = _ROTATION_MATRICES[(rotation_axis, n, counterclockwise)]
+
+        # Rotate all the node positions at once.
+        positions = list(self._graph.nodes)
+        rotated = (
+            np.array([p.as_tuple() for p in positions], dtype=np.int64).reshape(-1, 3)
+            @ rotation_matrix.T
+        )
+        rotated_positions = {
+            p: Position3D(*map(int, r)) for p, r in zip(positions, rotated)
+        }
 
         def _rotate(p: Position3D) -> Position3D:
-            rot_vec = np.array([0, 0, 0])
-            axis_idx = rotation_axis.value
-            rot_vec[axis_idx] = 1 if axis_idx != 1 else -1
-            if not counterclockwise:
-                rot_vec *= -1
-            rotated = R.from_rotvec(rot_vec * n * np.pi / 2).apply(p.as_tuple())
-            return Position3D(*[round_or_fail(i) for i in rotated])
+            return rotated_positions[p]
 
         name_suffix = f" rotated by {n * 90} degrees {'counter' if counterclockwise else ''}clockwise around the {rotation_axis.name} axis"
         g = self.__class__(self.name + name_suffix)
+        # The rotation is a bijection between valid graphs, so the nodes and
+        # edges of the rotated graph can be inserted without conflict checks.
+        rotated_nodes: dict[Position3D, ZXNode] = {}
         for node in self.nodes:
-            g.add_node(ZXNode(_rotate(node.position), node.kind, node.label))
+            rotated_node = ZXNode(_rotate(node.position), node.kind, node.label)
+            rotated_nodes[node.position] = rotated_node
+            g.add_node(rotated_node, check_conflict=False)
 
         for edge in self.edges:
-            u, v = edge
-            g.add_edge(
-                ZXNode(_rotate(u.position), u.kind, u.label),
-                ZXNode(_rotate(v.position), v.kind, v.label),
-                has_hadamard=edge.has_hadamard,
-            )
+            u = rotated_nodes[edge.u.position]
+            v = rotated_nodes[edge.v.position]
+            g._add_edge_unchecked(u, v, ZXEdge(u, v, edge.has_hadamard))
         return g
+
+
+def _build_rotation_matrices() -> dict[
+    tuple[Direction3D, int, bool], npt.NDArray[np.int64]
+]:
+    """Build the integer matrices of all the 90-degree rotations.
+
+    The returned dictionary maps ``(rotation_axis, num_90_degree_rotation,
+    counterclockwise)`` to the corresponding rotation matrix, with
+    ``num_90_degree_rotation`` in ``range(4)``. The counterclockwise rotation
+    around the ``Y`` axis is done around the negative ``Y`` direction.
+    """
+    counterclockwise_quarter_turns = {
+        Direction3D.X: np.array([[1, 0, 0], [0, 0, -1], [0, 1, 0]], dtype=np.int64),
+        Direction3D.Y: np.array([[0, 0, -1], [0, 1, 0], [1, 0, 0]], dtype=np.int64),
+        Direction3D.Z: np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]], dtype=np.int64),
+    }
+    matrices: dict[tuple[Direction3D, int, bool], npt.NDArray[np.int64]] = {}
+    for axis, quarter_turn in counterclockwise_quarter_turns.items():
+        for n in range(4):
+            matrix = np.linalg.matrix_power(quarter_turn, n)
+            matrices[(axis, n, True)] = matrix
+            # The inverse of a rotation matrix is its transpose.
+            matrices[(axis, n, False)] = matrix.T
+    return matrices
+
+
+_ROTATION_MATRICES: Final = _build_rotation_matrices()
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from tqec.utils.exceptions import TQECException
@@ -48,6 +50,11 @@ def test_zx_edge() -> None:
     assert edge.has_hadamard
     assert str(edge) == "X(2,0,0)-H-Y(2,1,0)"
     assert edge.direction == Direction3D.Y
+    assert not hasattr(edge, "__dict__")
+    assert edge == ZXEdge(edge.v, edge.u, has_hadamard=True)
+    unpickled_edge = pickle.loads(pickle.dumps(edge))
+    assert unpickled_edge == edge
+    assert unpickled_edge.direction == Direction3D.Y
 
 
 def test_zx_graph_construction() -> None:
@@ -174,6 +181,12 @@ def test_zx_graph_with_zx_flipped() -> None:
 
 
 def test_zx_graph_check_invariants() -> None:
+    with pytest.raises(
+        TQECException,
+        match="The ZX graph must be a single connected component",
+    ):
+        ZXGraph().check_invariants()
+
     g = ZXGraph()
     g.add_node(ZXNode(Position3D(0, 0, 0), ZXKind.Z))
     g.add_node(ZXNode(Position3D(1, 0, 0), ZXKind.X))
@@ -218,3 +231,10 @@ def test_zx_graph_rotate() -> None:
     assert g4[Position3D(-1, 1, 1)].kind == ZXKind.X
     assert g4.has_edge_between(Position3D(0, 0, 1), Position3D(0, 1, 1))
     assert g4.rotate(Direction3D.Z, 1, False) == g
+
+
+@pytest.mark.parametrize("axis", list(Direction3D))
+def test_zx_graph_rotate_composition(axis: Direction3D) -> None:
+    g = logical_cz_zx_graph("XI -> XZ")
+    assert g.rotate(axis, 3) == g.rotate(axis, 1, False)
+    assert g.rotate(axis, 1).rotate(axis, 1) == g.rotate(axis, 2)
@@ -12,7 +12,7 @@ from mpl_toolkits.mplot3d.axes3d import Axes3D
 from tqec.computation.correlation import CorrelationSurface
 from tqec.interop.color import RGBA, TQECColor
 from tqec.utils.position import Position3D
-from tqec.computation.zx_graph import ZXKind, ZXGraph, ZXNode
+from tqec.computation.zx_graph import ZXKind, ZXGraph
 
 NODE_COLOR: dict[ZXKind, RGBA] = {
     ZXKind.X: TQECColor.X.rgba,
@@ -116,9 +116,10 @@ def draw_correlation_surface_on(
         ax: The 3-dimensional ax to draw on.
         correlation_edge_width: The width of the correlation edges. Default is 3.
     """
-    span = correlation_surface.span
-    if isinstance(span, ZXNode):
+    # A correlation surface with a single node has no edge to draw.
+    if correlation_surface.has_single_node:
         return
+    span = correlation_surface.span
     correlation_types = correlation_surface.observables_at_nodes
     processed_edges: set[tuple[Position3D, Position3D]] = set()
     for edge in span:
@@ -7,6 +7,8 @@ from tqec.utils.exceptions import TQECException
 class CompilationPass(ABC):
     """Base interface that should be implemented by all compilation passes."""
 
+    __slots__ = ()
+
     @abstractmethod
     def run(
         self, circuit: ScheduledCircuit, check_all_flows: bool = False
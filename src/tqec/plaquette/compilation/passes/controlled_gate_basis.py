@@ -12,6 +12,8 @@ from tqec.plaquette.compilation.passes.transformer.simplifiers import (
 
 
 class ChangeControlledGateBasisPass(ScheduledCircuitTransformationPass):
+    __slots__ = ()
+
     def __init__(
         self, basis: Basis, bcsched1: ScheduleFunction, bcsched2: ScheduleFunction
     ) -> None:
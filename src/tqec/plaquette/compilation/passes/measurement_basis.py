@@ -1,3 +1,5 @@
+from typing import Final
+
 from tqec.utils.enums import Basis
 from tqec.plaquette.compilation.passes.transformer import (
     InstructionCreator,
@@ -7,19 +9,29 @@ from tqec.plaquette.compilation.passes.transformer import (
 )
 
 
+def _get_transformations(basis: Basis) -> tuple[ScheduledCircuitTransformation, ...]:
+    return (
+        ScheduledCircuitTransformation(
+            basis.flipped().measurement_instruction,
+            {
+                ScheduleOffset(-1): [InstructionCreator("H")],
+                ScheduleOffset(0): [InstructionCreator(basis.measurement_instruction)],
+            },
+        ),
+    )
+
+
+# The transformations only depend on the basis, so they are built once and
+# shared by all the passes.
+_TRANSFORMATIONS_BY_BASIS: Final[
+    dict[Basis, tuple[ScheduledCircuitTransformation, ...]]
+] = {basis: _get_transformations(basis) for basis in Basis}
+
+
 class ChangeMeasurementBasisPass(ScheduledCircuitTransformationPass):
     """Change ``MX`` and ``MZ`` instructions to the provided basis."""
 
+    __slots__ = ()
+
     def __init__(self, basis: Basis):
-        ibasis = Basis.X if basis == Basis.Z else Basis.Z
-        transformations = [
-            ScheduledCircuitTransformation(
-                f"M{ibasis.value.upper()}",
-                {
-                    ScheduleOffset(-1): [InstructionCreator("H")],
-                    ScheduleOffset(0): [InstructionCreator(f"M{basis.value.upper()}")],
-                },
-            )
-        ]
-
-        super().__init__(transformations)
+        super().__init__(_TRANSFORMATIONS_BY_BASIS[basis])
@@ -17,6 +17,10 @@ def test_compilation_pass_creation() -> None:
     ChangeMeasurementBasisPass(Basis.Z)
 
 
+def test_compilation_pass_has_no_instance_dict() -> None:
+    assert not hasattr(ChangeMeasurementBasisPass(Basis.X), "__dict__")
+
+
 def test_simple_measurement_basis() -> None:
     compilation_pass = ChangeMeasurementBasisPass(Basis.Z)
     assert compilation_pass.run(_s("M 0")) == _s("M 0")
@@ -39,3 +43,26 @@ def test_edge_cases_measurement_basis() -> None:
     compilation_pass = ChangeMeasurementBasisPass(Basis.Z)
     assert compilation_pass.run(_s("H 0")) == _s("H 0")
     assert compilation_pass.run(_s("")) == _s("")
+
+
+def test_created_instructions_are_batched() -> None:
+    compilation_pass = ChangeMeasurementBasisPass(Basis.Z)
+    compiled = compilation_pass.run(_s("TICK\nMX 0\nH 2\nMX 1"))
+    assert compiled == _s("H 0 1\nTICK\nM 0\nH 2\nM 1")
+
+
+def test_created_instructions_keep_measurement_order() -> None:
+    compilation_pass = ChangeMeasurementBasisPass(Basis.Z)
+    compiled = compilation_pass.run(
+        _s("TICK\nMX 0\nMZ 2\nMX 1\nDETECTOR rec[-1]\nDETECTOR rec[-2]")
+    )
+    assert compiled == _s("H 0 1\nTICK\nM 0 2 1\nDETECTOR rec[-1]\nDETECTOR rec[-2]")
+    measured_qubits = [
+        target.value
+        for instruction in compiled.get_circuit()
+        if instruction.name == "M"
+        for target in instruction.targets_copy()
+    ]
+    # rec[-1] and rec[-2] still refer to the measurements of qubits 1 and 2.
+    assert measured_qubits[-1] == 1
+    assert measured_qubits[-2] == 2
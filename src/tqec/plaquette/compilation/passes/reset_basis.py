@@ -1,3 +1,5 @@
+from typing import Final
+
 from tqec.utils.enums import Basis
 from tqec.plaquette.compilation.passes.transformer import (
     InstructionCreator,
@@ -7,19 +9,27 @@ from tqec.plaquette.compilation.passes.transformer import (
 )
 
 
+def _get_transformations(basis: Basis) -> tuple[ScheduledCircuitTransformation, ...]:
+    return (
+        ScheduledCircuitTransformation(
+            basis.flipped().reset_instruction,
+            {
+                ScheduleOffset(0): [InstructionCreator(basis.reset_instruction)],
+                ScheduleOffset(1): [InstructionCreator("H")],
+            },
+        ),
+    )
+
+
+_TRANSFORMATIONS_BY_BASIS: Final[
+    dict[Basis, tuple[ScheduledCircuitTransformation, ...]]
+] = {basis: _get_transformations(basis) for basis in Basis}
+
+
 class ChangeResetBasisPass(ScheduledCircuitTransformationPass):
     """Change ``RX`` and ``RZ`` instructions to the provided basis."""
 
+    __slots__ = ()
+
     def __init__(self, basis: Basis):
-        ibasis = Basis.X if basis == Basis.Z else Basis.Z
-        transformations = [
-            ScheduledCircuitTransformation(
-                f"R{ibasis.value.upper()}",
-                {
-                    ScheduleOffset(0): [InstructionCreator(f"R{basis.value.upper()}")],
-                    ScheduleOffset(1): [InstructionCreator("H")],
-                },
-            )
-        ]
-
-        super().__init__(transformations)
+        super().__init__(_TRANSFORMATIONS_BY_BASIS[basis])
@@ -37,3 +37,11 @@ def test_edge_cases_reset_basis() -> None:
     compilation_pass = ChangeResetBasisPass(Basis.Z)
     assert compilation_pass.run(_s("H 0")) == _s("H 0")
     assert compilation_pass.run(_s("")) == _s("")
+
+
+def test_reset_basis_nothing_to_change() -> None:
+    compilation_pass = ChangeResetBasisPass(Basis.Z)
+    circuit = _s("RZ 0\nTICK\nH 0")
+    compiled = compilation_pass.run(circuit)
+    assert compiled == circuit
+    assert compiled is not circuit
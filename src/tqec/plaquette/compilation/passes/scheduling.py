@@ -52,6 +52,8 @@ class ScheduleMap:
 class ChangeSchedulePass(CompilationPass):
     """Compilation pass changing the schedule of the provided quantum circuit."""
 
+    __slots__ = ("_map",)
+
     def __init__(self, schedule_map: dict[int, int]):
         super().__init__()
         self._map = ScheduleMap(schedule_map)
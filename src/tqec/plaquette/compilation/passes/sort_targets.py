@@ -25,6 +25,8 @@ class SortTargetsPass(CompilationPass):
     """Compilation pass sorting the targets of the provided quantum circuit
     instructions."""
 
+    __slots__ = ()
+
     @override
     def run(
         self, circuit: ScheduledCircuit, check_all_flows: bool = False
@@ -9,12 +9,14 @@ from tqec.utils.exceptions import TQECException
 class ScheduleFunction(ABC):
     """Interface for classes that can map schedules to other schedules."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __call__(self, input_schedule: int) -> int:
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScheduleOffset(ScheduleFunction):
     """Maps a schedule by applying a relative offset to it."""
 
@@ -25,7 +27,7 @@ class ScheduleOffset(ScheduleFunction):
         return input_schedule + self.offset
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScheduleConstant(ScheduleFunction):
     """Maps a schedule to a constant."""
 
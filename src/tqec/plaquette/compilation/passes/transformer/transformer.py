@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from copy import deepcopy
+from dataclasses import dataclass, field
 from typing import Callable, Sequence
 
 import stim
@@ -14,7 +15,7 @@ from tqec.plaquette.compilation.passes.transformer.simplifiers import (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InstructionCreator:
     """Create an instruction from targets and arguments."""
 
@@ -32,7 +33,15 @@ class InstructionCreator:
         )
 
 
-@dataclass
+# Name, targets and arguments creation functions of an InstructionCreator.
+_CreatorParts = tuple[
+    str,
+    Callable[[list[stim.GateTarget]], list[stim.GateTarget]],
+    Callable[[list[float]], list[float]],
+]
+
+
+@dataclass(frozen=True, slots=True)
 class ScheduledCircuitTransformation:
     """Describes an instruction transformation.
 
@@ -53,26 +62,121 @@ class ScheduledCircuitTransformation:
     source_name: str
     transformation: dict[ScheduleFunction, list[InstructionCreator]]
     instruction_simplifier: InstructionSimplifier = NoInstructionSimplification()
+    _source_names: frozenset[str] = field(init=False, repr=False, compare=False)
+    _creators: tuple[tuple[ScheduleFunction, tuple[_CreatorParts, ...]], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # All the names that refer to the transformed instruction, looked up
+        # once instead of for each instruction of the transformed circuits.
+        object.__setattr__(
+            self,
+            "_source_names",
+            frozenset(stim.gate_data(self.source_name).aliases),
+        )
+        # The instruction creators are fixed at construction, so their
+        # attributes are only read once here instead of in the loop over the
+        # transformed instructions.
+        creators = tuple(
+            (
+                schedule_function,
+                tuple(
+                    (creator.name, creator.targets, creator.arguments)
+                    for creator in instr_creators
+                ),
+            )
+            for schedule_function, instr_creators in self.transformation.items()
+        )
+        object.__setattr__(self, "_creators", creators)
 
     def apply(self, circuit: ScheduledCircuit) -> ScheduledCircuit:
+        if not any(
+            instruction.name in self._source_names
+            for moment in circuit.moments
+            for instruction in moment.instructions
+        ):
+            # Nothing to transform: all the moments are left untouched (apart
+            # from the empty ones that are removed, as in the general case).
+            scheduled_moments = [
+                (schedule, moment)
+                for schedule, moment in circuit.scheduled_moments
+                if not moment.is_empty
+            ]
+            return ScheduledCircuit(
+                [deepcopy(moment) for _, moment in scheduled_moments],
+                [schedule for schedule, _ in scheduled_moments],
+                circuit.qubit_map,
+            )
         # moment_instructions: schedule_index -> instruction list.
         moment_instructions: dict[int, list[stim.CircuitInstruction]] = {}
+        # Moments at schedules that are not modified by the transformation are
+        # copied instead of being re-built instruction by instruction.
+        original_moments: dict[int, Moment] = {}
+        modified_schedules: set[int] = set()
+        # Consecutive instructions created at the same schedule with the same
+        # name and arguments are batched into a single instruction. Only
+        # consecutive instructions are batched, so that the order of the
+        # measurement records is left unchanged.
+        # last_created: schedule -> (name, args, index, targets) of the last
+        # instruction created at that schedule.
+        last_created: dict[
+            int, tuple[str, tuple[float, ...], int, list[stim.GateTarget]]
+        ] = {}
+        # batched: (schedule, index) -> (name, args, index, targets).
+        batched: dict[
+            tuple[int, int],
+            tuple[str, tuple[float, ...], int, list[stim.GateTarget]],
+        ] = {}
         for schedule, moment in circuit.scheduled_moments:
+            original_moments[schedule] = moment
             for instruction in moment.instructions:
                 # if the transformation represented by self does not apply to
                 # the current instruction, just add it unmodified.
-                if instruction.name not in stim.gate_data(self.source_name).aliases:
+                if instruction.name not in self._source_names:
                     moment_instructions.setdefault(schedule, []).append(instruction)
                     continue
                 # else, for each instruction creator in self.transformation, add
                 # the created instruction to the target moment.
                 targets = instruction.targets_copy()
                 args = instruction.gate_args_copy()
-                for schedule_function, instr_creators in self.transformation.items():
+                modified_schedules.add(schedule)
+                for schedule_function, creators in self._creators:
                     sched: int = schedule_function(schedule)
-                    moment_instructions.setdefault(sched, []).extend(
-                        creator(targets, args) for creator in instr_creators
-                    )
+                    modified_schedules.add(sched)
+                    instructions = moment_instructions.setdefault(sched, [])
+                    for name, targets_creator, arguments_creator in creators:
+                        # Compute the created targets and arguments directly
+                        # instead of copying them back from the created
+                        # instruction.
+                        new_targets = targets_creator(targets)
+                        new_args = arguments_creator(args)
+                        arguments = tuple(new_args)
+                        last = last_created.get(sched)
+                        if (
+                            last is not None
+                            and last[0] == name
+                            and last[1] == arguments
+                            and last[2] == len(instructions) - 1
+                        ):
+                            last[3].extend(new_targets)
+                            batched[(sched, last[2])] = last
+                            continue
+                        # Copy the targets as they may be extended in place
+                        # and the default creator returns its input list.
+                        last_created[sched] = (
+                            name,
+                            arguments,
+                            len(instructions),
+                            list(new_targets),
+                        )
+                        instructions.append(
+                            stim.CircuitInstruction(name, new_targets, new_args)
+                        )
+        for (sched, index), (name, args, _, trgts) in batched.items():
+            moment_instructions[sched][index] = stim.CircuitInstruction(
+                name, trgts, args
+            )
         # Make sure that the schedules are given to ScheduledCircuit as a
         # sorted list.
         schedules = sorted(moment_instructions.keys())
@@ -81,6 +185,8 @@ class ScheduledCircuitTransformation:
                 # Try to simplify operations before creating the moment.
                 self.instruction_simplifier.simplify(moment_instructions[s])
             )
+            if s in modified_schedules
+            else deepcopy(original_moments[s])
             for s in schedules
         ]
         return ScheduledCircuit(all_moments, schedules, circuit.qubit_map)
@@ -115,6 +221,8 @@ class ScheduledCircuitTransformer:
 class ScheduledCircuitTransformationPass(CompilationPass):
     """Apply the provided transformations as a compilation pass."""
 
+    __slots__ = ("_transformations",)
+
     def __init__(
         self,
         transformations: Sequence[ScheduledCircuitTransformation],
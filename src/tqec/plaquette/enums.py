@@ -10,14 +10,7 @@ class PlaquetteOrientation(Enum):
     UP = auto()
 
     def to_plaquette_side(self) -> PlaquetteSide:
-        if self == PlaquetteOrientation.RIGHT:
-            return PlaquetteSide.LEFT
-        elif self == PlaquetteOrientation.LEFT:
-            return PlaquetteSide.RIGHT
-        elif self == PlaquetteOrientation.DOWN:
-            return PlaquetteSide.UP
-        else:  # if self == PlaquetteOrientation.UP:
-            return PlaquetteSide.DOWN
+        return _ORIENTATION_TO_SIDE[self]
 
 
 class PlaquetteSide(Enum):
@@ -27,11 +20,19 @@ class PlaquetteSide(Enum):
     UP = auto()
 
     def opposite(self) -> PlaquetteSide:
-        if self == PlaquetteSide.RIGHT:
-            return PlaquetteSide.LEFT
-        elif self == PlaquetteSide.LEFT:
-            return PlaquetteSide.RIGHT
-        elif self == PlaquetteSide.DOWN:
-            return PlaquetteSide.UP
-        else:
-            return PlaquetteSide.DOWN
+        return _OPPOSITE_SIDE[self]
+
+
+_ORIENTATION_TO_SIDE: dict[PlaquetteOrientation, PlaquetteSide] = {
+    PlaquetteOrientation.RIGHT: PlaquetteSide.LEFT,
+    PlaquetteOrientation.LEFT: PlaquetteSide.RIGHT,
+    PlaquetteOrientation.DOWN: PlaquetteSide.UP,
+    PlaquetteOrientation.UP: PlaquetteSide.DOWN,
+}
+
+_OPPOSITE_SIDE: dict[PlaquetteSide, PlaquetteSide] = {
+    PlaquetteSide.RIGHT: PlaquetteSide.LEFT,
+    PlaquetteSide.LEFT: PlaquetteSide.RIGHT,
+    PlaquetteSide.DOWN: PlaquetteSide.UP,
+    PlaquetteSide.UP: PlaquetteSide.DOWN,
+}
@@ -106,9 +106,11 @@ class _CSSPlaquetteBuilder:
         else:
             moment_index = -1
             self._data_meas = basis, only_on_side
-        op = "M" if is_measurement else "R"
+        instruction = (
+            basis.measurement_instruction if is_measurement else basis.reset_instruction
+        )
         self._moments[moment_index].append(
-            f"{op}{basis.value}", self._get_data_qubits(only_on_side), []
+            instruction, self._get_data_qubits(only_on_side), []
         )
 
     def _build_memory_moments(self) -> list[Moment]:
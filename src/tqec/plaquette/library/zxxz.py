@@ -119,8 +119,12 @@ class _ZXXZPlaquetteBuilder:
             dqs_considered
         )
         h_targets = {0} | basis_change_dqs ^ h_cancel_out
+        # A single H instruction on distinct targets is a valid moment that uses
+        # exactly h_targets, so there is no need to re-scan the circuit.
         self._moments[h_moment_idx] = Moment(
-            stim.Circuit(f"H {' '.join(map(str, h_targets))}")
+            stim.Circuit(f"H {' '.join(map(str, h_targets))}"),
+            used_qubits=h_targets,
+            _avoid_checks=True,
         )
 
     def _build_memory_moments(self) -> list[Moment]:
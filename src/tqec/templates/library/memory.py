@@ -1,3 +1,5 @@
+from functools import cache
+
 from tqec.utils.enums import Basis
 from tqec.plaquette.rpng import RPNGDescription
 from tqec.templates.enums import ZObservableOrientation
@@ -9,6 +11,7 @@ from tqec.templates.qubit import (
 from tqec.utils.frozendefaultdict import FrozenDefaultDict
 
 
+@cache
 def get_memory_qubit_raw_template() -> QubitTemplate:
     """Returns the :class:`~tqec.templates.base.Template` instance
     needed to implement a single logical qubit.
@@ -19,6 +22,7 @@ def get_memory_qubit_raw_template() -> QubitTemplate:
     return QubitTemplate()
 
 
+@cache
 def get_memory_qubit_rpng_descriptions(
     orientation: ZObservableOrientation = ZObservableOrientation.HORIZONTAL,
     reset: Basis | None = None,
@@ -83,6 +87,7 @@ def get_memory_qubit_rpng_descriptions(
     )
 
 
+@cache
 def get_memory_vertical_boundary_raw_template() -> QubitVerticalBorders:
     """Returns the :class:`~tqec.templates.base.Template` instance
     needed to implement a regular spatial pipe between two logical qubits
@@ -94,6 +99,7 @@ def get_memory_vertical_boundary_raw_template() -> QubitVerticalBorders:
     return QubitVerticalBorders()
 
 
+@cache
 def get_memory_vertical_boundary_rpng_descriptions(
     orientation: ZObservableOrientation = ZObservableOrientation.HORIZONTAL,
     reset: Basis | None = None,
@@ -162,6 +168,7 @@ def get_memory_vertical_boundary_rpng_descriptions(
     )
 
 
+@cache
 def get_memory_horizontal_boundary_raw_template() -> QubitHorizontalBorders:
     """Returns the :class:`~tqec.templates.base.Template` instance
     needed to implement a regular spatial pipe between two logical qubits
@@ -173,6 +180,7 @@ def get_memory_horizontal_boundary_raw_template() -> QubitHorizontalBorders:
     return QubitHorizontalBorders()
 
 
+@cache
 def get_memory_horizontal_boundary_rpng_descriptions(
     orientation: ZObservableOrientation = ZObservableOrientation.HORIZONTAL,
     reset: Basis | None = None,
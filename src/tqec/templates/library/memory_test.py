@@ -3,6 +3,7 @@ from typing import Final
 from tqec.utils.enums import Basis
 from tqec.plaquette.rpng import RPNGDescription
 from tqec.templates.enums import ZObservableOrientation
+from tqec.templates.library.memory import get_memory_qubit_rpng_descriptions
 
 from ._testing import (
     get_memory_horizontal_boundary_rpng_template,
@@ -259,3 +260,15 @@ def test_memory_horizontal_boundary_vertical_z_observable_measure_x() -> None:
         [__X_Xt, _ZZZZt, _XXXXt, _ZZZZt, _XXXXt, _EMPT],
         [_EMPT, _XXXXb, _ZZZZb, _XXXXb, _ZZZZb, _X_X_b],
     ]
+
+
+def test_memory_qubit_rpng_descriptions_are_cached() -> None:
+    descriptions = get_memory_qubit_rpng_descriptions(
+        ZObservableOrientation.VERTICAL, Basis.Z, None
+    )
+    assert (
+        get_memory_qubit_rpng_descriptions(
+            ZObservableOrientation.VERTICAL, Basis.Z, None
+        )
+        is descriptions
+    )
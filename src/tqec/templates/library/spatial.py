@@ -7,6 +7,9 @@ This module provides 2 functions to create
 - :func:`get_spatial_cube_qubit_template` that creates spatial cubes,
 - and :func:`get_spatial_cube_arm_template` that creates the arms.
 
+All the public functions of this module are cached: their return values are
+immutable and can be freely shared between callers.
+
 ## Terminology
 
 In this module, a **spatial cube** always refers to the logical qubit that
@@ -15,6 +18,10 @@ has all the spatial boundaries in the same basis.
 The spatial pipes connected to the spatial cubes are called **arms**.
 """
 
+from collections.abc import Callable
+from functools import cache
+from typing import Final
+
 from tqec.compile.specs.enums import SpatialArms
 from tqec.utils.enums import Basis
 from tqec.utils.exceptions import TQECException
@@ -27,6 +34,7 @@ from tqec.templates.qubit import (
 from tqec.utils.frozendefaultdict import FrozenDefaultDict
 
 
+@cache
 def get_spatial_cube_qubit_raw_template() -> QubitSpatialCubeTemplate:
     """Returns the :class:`~tqec.templates.base.Template` instance
     needed to implement a spatial cube.
@@ -46,6 +54,7 @@ def get_spatial_cube_qubit_raw_template() -> QubitSpatialCubeTemplate:
     return QubitSpatialCubeTemplate()
 
 
+@cache
 def get_spatial_cube_qubit_rpng_descriptions(
     spatial_boundary_basis: Basis,
     arms: SpatialArms,
@@ -247,6 +256,7 @@ def get_spatial_cube_qubit_rpng_descriptions(
     )
 
 
+@cache
 def get_spatial_cube_arm_raw_template(
     arm: SpatialArms,
 ) -> QubitVerticalBorders | QubitHorizontalBorders:
@@ -280,6 +290,7 @@ def get_spatial_cube_arm_raw_template(
         raise TQECException(f"Unrecognized spatial arm: {arm}.")
 
 
+@cache
 def get_spatial_cube_arm_rpng_descriptions(
     spatial_boundary_basis: Basis,
     arm: SpatialArms,
@@ -338,27 +349,13 @@ def get_spatial_cube_arm_rpng_descriptions(
         a description of the plaquettes needed to implement **one** pipe
         connecting to a spatial cube.
     """
-    match arm:
-        case SpatialArms.LEFT:
-            return _get_left_spatial_cube_arm_rpng_descriptions(
-                spatial_boundary_basis, reset, measurement
-            )
-        case SpatialArms.RIGHT:
-            return _get_right_spatial_cube_arm_rpng_descriptions(
-                spatial_boundary_basis, reset, measurement
-            )
-        case SpatialArms.UP:
-            return _get_up_spatial_cube_arm_rpng_descriptions(
-                spatial_boundary_basis, reset, measurement
-            )
-        case SpatialArms.DOWN:
-            return _get_down_spatial_cube_arm_rpng_descriptions(
-                spatial_boundary_basis, reset, measurement
-            )
-        case _:
-            raise TQECException(
-                f"The 'arm' parameter should contain exactly 1 flag. Got {arm}."
-            )
+    if arm not in _ARM_RPNG_DESCRIPTIONS_BUILDERS:
+        raise TQECException(
+            f"The 'arm' parameter should contain exactly 1 flag. Got {arm}."
+        )
+    return _ARM_RPNG_DESCRIPTIONS_BUILDERS[arm](
+        spatial_boundary_basis, reset, measurement
+    )
 
 
 def _get_left_spatial_cube_arm_rpng_descriptions(
@@ -475,3 +472,19 @@ def _get_down_spatial_cube_arm_rpng_descriptions(
         },
         default_factory=lambda: RPNGDescription.from_string("---- ---- ---- ----"),
     )
+
+
+_ARM_RPNG_DESCRIPTIONS_BUILDERS: Final[
+    dict[
+        SpatialArms,
+        Callable[
+            [Basis, Basis | None, Basis | None],
+            FrozenDefaultDict[int, RPNGDescription],
+        ],
+    ]
+] = {
+    SpatialArms.LEFT: _get_left_spatial_cube_arm_rpng_descriptions,
+    SpatialArms.RIGHT: _get_right_spatial_cube_arm_rpng_descriptions,
+    SpatialArms.UP: _get_up_spatial_cube_arm_rpng_descriptions,
+    SpatialArms.DOWN: _get_down_spatial_cube_arm_rpng_descriptions,
+}
@@ -1,7 +1,8 @@
 """Defines templates representing logical qubits and its constituent parts."""
 
 import warnings
-from typing import Sequence
+from collections.abc import Mapping
+from typing import Final, Sequence
 
 import numpy
 import numpy.typing as npt
@@ -12,6 +13,35 @@ from tqec.templates.base import BorderIndices, RectangularTemplate
 from tqec.templates.enums import TemplateBorder
 from tqec.utils.scale import LinearFunction, Scalable2D
 
+# Border indices do not depend on the template instance, so they are computed
+# once here instead of on each call to ``get_border_indices``.
+_QUBIT_TEMPLATE_BORDER_INDICES: Final[Mapping[TemplateBorder, BorderIndices]] = {
+    TemplateBorder.TOP: BorderIndices(1, 5, 6, 2),
+    TemplateBorder.BOTTOM: BorderIndices(3, 13, 14, 4),
+    TemplateBorder.LEFT: BorderIndices(1, 7, 8, 3),
+    TemplateBorder.RIGHT: BorderIndices(2, 11, 12, 4),
+}
+_QUBIT_SPATIAL_CUBE_TEMPLATE_BORDER_INDICES: Final[
+    Mapping[TemplateBorder, BorderIndices]
+] = {
+    TemplateBorder.TOP: BorderIndices(1, 9, 10, 2),
+    TemplateBorder.BOTTOM: BorderIndices(3, 20, 21, 4),
+    TemplateBorder.LEFT: BorderIndices(1, 11, 12, 3),
+    TemplateBorder.RIGHT: BorderIndices(2, 18, 19, 4),
+}
+_QUBIT_VERTICAL_BORDERS_BORDER_INDICES: Final[
+    Mapping[TemplateBorder, BorderIndices]
+] = {
+    TemplateBorder.LEFT: BorderIndices(1, 5, 6, 3),
+    TemplateBorder.RIGHT: BorderIndices(2, 7, 8, 4),
+}
+_QUBIT_HORIZONTAL_BORDERS_BORDER_INDICES: Final[
+    Mapping[TemplateBorder, BorderIndices]
+] = {
+    TemplateBorder.TOP: BorderIndices(1, 5, 6, 2),
+    TemplateBorder.BOTTOM: BorderIndices(3, 7, 8, 4),
+}
+
 
 class QubitTemplate(RectangularTemplate):
     """An error-corrected qubit.
@@ -72,15 +102,7 @@ class QubitTemplate(RectangularTemplate):
 
     @override
     def get_border_indices(self, border: TemplateBorder) -> BorderIndices:
-        match border:
-            case TemplateBorder.TOP:
-                return BorderIndices(1, 5, 6, 2)
-            case TemplateBorder.BOTTOM:
-                return BorderIndices(3, 13, 14, 4)
-            case TemplateBorder.LEFT:
-                return BorderIndices(1, 7, 8, 3)
-            case TemplateBorder.RIGHT:
-                return BorderIndices(2, 11, 12, 4)
+        return _QUBIT_TEMPLATE_BORDER_INDICES[border]
 
 
 class QubitSpatialCubeTemplate(RectangularTemplate):
@@ -186,15 +208,7 @@ class QubitSpatialCubeTemplate(RectangularTemplate):
 
     @override
     def get_border_indices(self, border: TemplateBorder) -> BorderIndices:
-        match border:
-            case TemplateBorder.TOP:
-                return BorderIndices(1, 9, 10, 2)
-            case TemplateBorder.BOTTOM:
-                return BorderIndices(3, 20, 21, 4)
-            case TemplateBorder.LEFT:
-                return BorderIndices(1, 11, 12, 3)
-            case TemplateBorder.RIGHT:
-                return BorderIndices(2, 18, 19, 4)
+        return _QUBIT_SPATIAL_CUBE_TEMPLATE_BORDER_INDICES[border]
 
 
 class QubitVerticalBorders(RectangularTemplate):
@@ -243,16 +257,12 @@ class QubitVerticalBorders(RectangularTemplate):
 
     @override
     def get_border_indices(self, border: TemplateBorder) -> BorderIndices:
-        match border:
-            case TemplateBorder.TOP | TemplateBorder.BOTTOM:
-                raise TQECException(
-                    f"Template {self.__class__.__name__} does not have repeating "
-                    f"elements on the {border.name} border."
-                )
-            case TemplateBorder.LEFT:
-                return BorderIndices(1, 5, 6, 3)
-            case TemplateBorder.RIGHT:
-                return BorderIndices(2, 7, 8, 4)
+        if border not in _QUBIT_VERTICAL_BORDERS_BORDER_INDICES:
+            raise TQECException(
+                f"Template {self.__class__.__name__} does not have repeating "
+                f"elements on the {border.name} border."
+            )
+        return _QUBIT_VERTICAL_BORDERS_BORDER_INDICES[border]
 
 
 class QubitHorizontalBorders(RectangularTemplate):
@@ -296,13 +306,9 @@ class QubitHorizontalBorders(RectangularTemplate):
 
     @override
     def get_border_indices(self, border: TemplateBorder) -> BorderIndices:
-        match border:
-            case TemplateBorder.TOP:
-                return BorderIndices(1, 5, 6, 2)
-            case TemplateBorder.BOTTOM:
-                return BorderIndices(3, 7, 8, 4)
-            case TemplateBorder.LEFT | TemplateBorder.RIGHT:
-                raise TQECException(
-                    f"Template {self.__class__.__name__} does not have repeating "
-                    f"elements on the {border.name} border."
-                )
+        if border not in _QUBIT_HORIZONTAL_BORDERS_BORDER_INDICES:
+            raise TQECException(
+                f"Template {self.__class__.__name__} does not have repeating "
+                f"elements on the {border.name} border."
+            )
+        return _QUBIT_HORIZONTAL_BORDERS_BORDER_INDICES[border]
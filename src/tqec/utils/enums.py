@@ -17,5 +17,21 @@ class Basis(Enum):
     def flipped(self) -> Basis:
         return Basis.X if self == Basis.Z else Basis.Z
 
+    @property
+    def reset_instruction(self) -> str:
+        """Name of the ``stim`` instruction resetting a qubit in ``self``."""
+        return _RESET_INSTRUCTIONS[self]
+
+    @property
+    def measurement_instruction(self) -> str:
+        """Name of the ``stim`` instruction measuring a qubit in ``self``."""
+        return _MEASUREMENT_INSTRUCTIONS[self]
+
     def __str__(self) -> str:
         return self.value
+
+
+_RESET_INSTRUCTIONS: dict[Basis, str] = {basis: f"R{basis.value}" for basis in Basis}
+_MEASUREMENT_INSTRUCTIONS: dict[Basis, str] = {
+    basis: f"M{basis.value}" for basis in Basis
+}
@@ -4,3 +4,10 @@ from tqec.utils.enums import Basis
 def test_zx_basis() -> None:
     assert Basis.Z.flipped() == Basis.X
     assert Basis.X.flipped() == Basis.Z
+
+
+def test_basis_instructions() -> None:
+    assert Basis.X.reset_instruction == "RX"
+    assert Basis.Z.reset_instruction == "RZ"
+    assert Basis.X.measurement_instruction == "MX"
+    assert Basis.Z.measurement_instruction == "MZ"
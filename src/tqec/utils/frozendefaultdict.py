@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from copy import deepcopy
 from typing import Callable, Generic, Iterable, Iterator, TypeVar, cast
 
 from typing_extensions import override
@@ -65,9 +64,11 @@ class FrozenDefaultDict(Generic[K, V], Mapping[K, V]):
         return self._dict.__contains__(key)
 
     def __or__(self, other: Mapping[K, V]) -> FrozenDefaultDict[K, V]:
-        mapping = deepcopy(self._dict)
-        mapping.update(other)
-        return FrozenDefaultDict(mapping, default_factory=self._default_factory)
+        # self is immutable, so the values can be shared with the new instance
+        # and only the (cheap) dictionary structure has to be copied.
+        return FrozenDefaultDict(
+            self._dict | dict(other), default_factory=self._default_factory
+        )
 
     def __hash__(self) -> int:
         return hash(tuple(sorted(self.items())))
@@ -94,15 +95,16 @@ class FrozenDefaultDict(Generic[K, V], Mapping[K, V]):
 
     def map_keys(self, callable: Callable[[K], K]) -> FrozenDefaultDict[K, V]:
         return FrozenDefaultDict(
-            {callable(k): v for k, v in self.items()},
+            {callable(k): v for k, v in self._dict.items()},
             default_factory=self._default_factory,
         )
 
     def map_values(self, callable: Callable[[V], Vp]) -> FrozenDefaultDict[K, Vp]:
         default_factory: Callable[[], Vp] | None = None
-        if self.default_factory is not None:
-            default_value = callable(self.default_factory())
+        if self._default_factory is not None:
+            default_value = callable(self._default_factory())
             default_factory = lambda: default_value  # noqa: E731
         return FrozenDefaultDict(
-            {k: callable(v) for k, v in self.items()}, default_factory=default_factory
+            {k: callable(v) for k, v in self._dict.items()},
+            default_factory=default_factory,
         )
@@ -0,0 +1,25 @@
+import pytest
+
+from tqec.utils.frozendefaultdict import FrozenDefaultDict
+
+
+def test_frozendefaultdict_default_factory() -> None:
+    fdd = FrozenDefaultDict({1: 2}, default_factory=lambda: 0)
+    assert fdd[1] == 2
+    assert fdd[3] == 0
+    assert 3 not in fdd
+
+    with pytest.raises(KeyError):
+        FrozenDefaultDict({1: 2})[3]
+
+
+def test_frozendefaultdict_map_values() -> None:
+    mapped = FrozenDefaultDict({1: 2, 3: 4}, default_factory=lambda: 0).map_values(
+        lambda v: v + 1
+    )
+    assert dict(mapped) == {1: 3, 3: 5}
+    assert mapped[5] == 1
+
+    mapped_str = FrozenDefaultDict({1: 2}).map_values(str)
+    assert dict(mapped_str) == {1: "2"}
+    assert not mapped_str.has_default_factory()
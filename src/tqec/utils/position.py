@@ -26,20 +26,20 @@ indexing.
 
 from __future__ import annotations
 
-from dataclasses import astuple, dataclass
+from dataclasses import dataclass
 from enum import Enum
 
 import numpy as np
 import numpy.typing as npt
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Vec2D:
     x: int
     y: int
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Vec3D:
     x: int
     y: int
@@ -56,6 +56,8 @@ class Position2D(Vec2D):
         is obvious. In particular, this class should be avoided in interfaces.
     """
 
+    __slots__ = ()
+
     def with_block_coordinate_system(self) -> BlockPosition2D:
         return BlockPosition2D(self.x, self.y)
 
@@ -63,10 +65,14 @@ class Position2D(Vec2D):
 class PhysicalQubitPosition2D(Position2D):
     """Represents the position of a physical qubit on a 2-dimensional plane."""
 
+    __slots__ = ()
+
 
 class PlaquettePosition2D(Position2D):
     """Represents the position of a plaquette on a 2-dimensional plane."""
 
+    __slots__ = ()
+
     def get_origin_position(self, displacement: Shift2D) -> PhysicalQubitPosition2D:
         """Returns the position of the plaquette origin."""
         return PhysicalQubitPosition2D(displacement.x * self.x, displacement.y * self.y)
@@ -75,6 +81,8 @@ class PlaquettePosition2D(Position2D):
 class BlockPosition2D(Position2D):
     """Represents the position of a block on a 2-dimensional plane."""
 
+    __slots__ = ()
+
     def get_top_left_plaquette_position(
         self, block_shape: Shape2D
     ) -> PlaquettePosition2D:
@@ -83,6 +91,8 @@ class BlockPosition2D(Position2D):
 
 
 class Shape2D(Vec2D):
+    __slots__ = ()
+
     def to_numpy_shape(self) -> tuple[int, int]:
         """Returns the shape according to numpy indexing.
 
@@ -95,6 +105,8 @@ class Shape2D(Vec2D):
 
 
 class Shift2D(Vec2D):
+    __slots__ = ()
+
     def __mul__(self, factor: int) -> Shift2D:
         return Shift2D(factor * self.x, factor * self.y)
 
@@ -105,6 +117,8 @@ class Shift2D(Vec2D):
 class Position3D(Vec3D):
     """A 3D integer position."""
 
+    __slots__ = ()
+
     x: int
     y: int
     z: int
@@ -131,7 +145,9 @@ class Position3D(Vec3D):
 
     def as_tuple(self) -> tuple[int, int, int]:
         """Return the position as a tuple."""
-        return astuple(self)
+        # Much faster than dataclasses.astuple, that recursively deep-copies
+        # the fields.
+        return (self.x, self.y, self.z)
 
     def __str__(self) -> str:
         return f"({self.x},{self.y},{self.z})"
@@ -157,7 +173,7 @@ class Direction3D(Enum):
         return self.name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignedDirection3D:
     """Signed directions in the 3D spacetime diagram."""
 
@@ -171,7 +187,7 @@ class SignedDirection3D:
         return f"{self.direction}{'+' if self.towards_positive else '-'}"
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class FloatPosition3D:
     """A 3D float position."""
 
@@ -196,4 +212,4 @@ class FloatPosition3D:
 
     def as_array(self) -> npt.NDArray[np.float32]:
         """Return the position as a numpy array."""
-        return np.asarray(astuple(self), dtype=np.float32)
+        return np.asarray((self.x, self.y, self.z), dtype=np.float32)
@@ -1,4 +1,4 @@
-from tqec.utils.position import Position2D, Position3D, Shape2D
+from tqec.utils.position import BlockPosition2D, Position2D, Position3D, Shape2D
 
 
 def test_position() -> None:
@@ -23,3 +23,8 @@ def test_position_3d() -> None:
     assert p1.is_neighbour(Position3D(-1, 0, 0))
     assert not p1.is_neighbour(Position3D(1, 0, 1))
     assert not p1.is_neighbour(Position3D(0, -1, 1))
+
+
+def test_positions_are_slotted() -> None:
+    assert not hasattr(Position3D(0, 1, 2), "__dict__")
+    assert not hasattr(BlockPosition2D(0, 1), "__dict__")